@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 """HTML templates for BookCrafter book sections."""
 
+import functools
+from html import escape
+
+import markdown
+
 # Base document wrapper
 BASE_TEMPLATE = """<!DOCTYPE html>
 <html lang="{language}">
@@ -86,15 +91,21 @@ BACK_COVER_TEMPLATE = """<section class="back-cover">
 </section>"""
 
 
+@functools.lru_cache(maxsize=1024)
+def _esc(value):
+    """HTML-escape a plain-text field (memoized; titles and authors repeat across renderers)."""
+    return escape(value, quote=True)
+
+
 def render_cover(data, config):
     """Render front cover."""
     meta = data.get('meta', {})
     # Optional publisher badge (e.g., '<div class="saufex-report">SAUFEX REPORT</div>')
     publisher_badge = meta.get('publisher_badge', config.get('publisher_badge', ''))
     return COVER_TEMPLATE.format(
-        title=meta.get('title', config.get('title', 'Untitled')),
-        subtitle=meta.get('subtitle', ''),
-        author=meta.get('author', config.get('author', '')),
+        title=_esc(meta.get('title', config.get('title', 'Untitled'))),
+        subtitle=_esc(meta.get('subtitle', '')),
+        author=_esc(meta.get('author', config.get('author', ''))),
         publisher_badge=publisher_badge
     )
 
@@ -103,7 +114,7 @@ def render_half_title(data, config):
     """Render half-title (bastard title) page."""
     content = data.get('content', '')
     return HALF_TITLE_TEMPLATE.format(
-        title=content or config.get('title', 'Untitled')
+        title=_esc(content or config.get('title', 'Untitled'))
     )
 
 
@@ -111,17 +122,16 @@ def render_title_page(data, config):
     """Render full title page."""
     meta = data.get('meta', {})
     return TITLE_PAGE_TEMPLATE.format(
-        title=meta.get('title', config.get('title', 'Untitled')),
-        subtitle=meta.get('subtitle', ''),
-        description=meta.get('description', ''),
-        author=meta.get('author', config.get('author', '')),
-        publisher=meta.get('publisher', '')
+        title=_esc(meta.get('title', config.get('title', 'Untitled'))),
+        subtitle=_esc(meta.get('subtitle', '')),
+        description=_esc(meta.get('description', '')),
+        author=_esc(meta.get('author', config.get('author', ''))),
+        publisher=_esc(meta.get('publisher', ''))
     )
 
 
 def render_copyright(data, config):
     """Render copyright page."""
-    import markdown
     md = markdown.Markdown()
     content = data.get('content', '')
     html = md.convert(content)
@@ -274,7 +284,7 @@ def assemble_book(frontmatter_html, content_html, backmatter_html, css, config):
 
     return BASE_TEMPLATE.format(
         language=config.get('language', 'en'),
-        title=config.get('title', 'Untitled'),
+        title=_esc(config.get('title', 'Untitled')),
         css=css,
         content=full_content
     )
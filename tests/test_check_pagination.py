@@ -0,0 +1,130 @@
+"""Tests for tools/check_pagination.py."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+pymupdf = pytest.importorskip("pymupdf")
+pdfplumber = pytest.importorskip("pdfplumber")
+
+from tools import check_pagination
+from tools.check_pagination import _PyMuPDFPage, _quick_table_bbox
+
+WORDS = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit"]
+
+
+@pytest.fixture
+def ruled_pdf(tmp_path):
+    """One page per case: lone rules, rules plus an ornament, a line grid, a cell grid.
+
+    The rules on the first two pages reach the bottom and top of the content
+    area, where a table would be reported as split across the pages.
+    """
+    path = tmp_path / "ruled.pdf"
+    doc = pymupdf.open()
+
+    page = doc.new_page(width=420, height=600)
+    for y in (140, 260, 380, 500):
+        page.insert_text((45, y - 20), "Section text above a rule", fontsize=11)
+        page.draw_line((45, y), (375, y))
+
+    page = doc.new_page(width=420, height=600)
+    for y in (100, 140, 180, 220):
+        page.draw_line((45, y), (375, y))
+    page.draw_rect(pymupdf.Rect(150, 300, 270, 340), radius=0.2)
+    page.draw_circle((210, 400), 20)
+
+    page = doc.new_page(width=420, height=600)
+    for y in (100, 120, 140, 160):
+        page.draw_line((45, y), (345, y))
+    for x in (45, 195, 345):
+        page.draw_line((x, 100), (x, 160))
+
+    page = doc.new_page(width=420, height=600)
+    for r in range(3):
+        for c in range(3):
+            page.draw_rect(pymupdf.Rect(45 + c * 100, 400 + r * 20, 145 + c * 100, 420 + r * 20))
+
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _bboxes(pdf_path):
+    """Table bbox per page from both backends, rounded to whole points."""
+    def rounded(bbox):
+        return bbox and tuple(round(v) for v in bbox)
+
+    with pdfplumber.open(str(pdf_path)) as pdf:
+        plumber = [rounded(_quick_table_bbox(page)) for page in pdf.pages]
+    with pymupdf.open(str(pdf_path)) as doc:
+        mupdf = [rounded(_quick_table_bbox(_PyMuPDFPage(page))) for page in doc]
+    return plumber, mupdf
+
+
+def test_rules_without_a_grid_are_not_tables(ruled_pdf):
+    plumber, mupdf = _bboxes(ruled_pdf)
+    assert plumber[:2] == mupdf[:2] == [None, None]
+
+
+def test_ruled_grids_are_tables(ruled_pdf):
+    plumber, mupdf = _bboxes(ruled_pdf)
+    assert plumber[2:] == mupdf[2:] == [(45, 100, 345, 160), (45, 400, 345, 460)]
+
+
+def test_rules_without_a_grid_are_not_split_tables(ruled_pdf):
+    issues = check_pagination.PaginationChecker(str(ruled_pdf)).analyze()
+    assert not [i for i in issues if i.type == "split_table"]
+
+
+FONT = Path(__file__).resolve().parent.parent / "fonts" / "CrimsonText-Regular.ttf"
+
+
+@pytest.fixture
+def book_pdf(tmp_path):
+    """Pages of word-by-word lines in an embedded font, starting and ending at varied heights."""
+    path = tmp_path / "book.pdf"
+    rng = random.Random(4)
+    font = pymupdf.Font(fontfile=str(FONT))
+    doc = pymupdf.open()
+    for _ in range(12):
+        page = doc.new_page(width=419.53, height=595.28)
+        writer = pymupdf.TextWriter(page.rect)
+        y = rng.uniform(60, 110)
+        bottom = rng.uniform(480, 530)
+        while y < bottom:
+            for _ in range(rng.randint(1, 5)):
+                x = 45
+                for word in rng.sample(WORDS, 6):
+                    writer.append((x, y), word, font=font, fontsize=10)
+                    x += font.text_length(word, fontsize=10) + 4
+                y += 14
+            y += rng.choice([0, 6, 12])
+        writer.write_text(page)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_pymupdf_chars_match_pdfplumber(book_pdf):
+    with pymupdf.open(str(book_pdf)) as doc:
+        mupdf = _PyMuPDFPage(doc[0]).chars
+    with pdfplumber.open(str(book_pdf)) as pdf:
+        plumber = pdf.pages[0].chars
+
+    assert [c['text'] for c in mupdf] == [c['text'] for c in plumber]
+    for a, b in zip(mupdf, plumber):
+        assert a['top'] == pytest.approx(b['top'], abs=0.01)
+        assert a['bottom'] == pytest.approx(b['bottom'], abs=0.01)
+
+
+def test_pymupdf_findings_match_pdfplumber(book_pdf, monkeypatch):
+    def findings():
+        issues = check_pagination.PaginationChecker(str(book_pdf)).analyze()
+        return sorted((i.type, i.page) for i in issues)
+
+    fast = findings()
+    assert any(kind in ("orphan", "widow") for kind, _ in fast)
+    monkeypatch.setattr(check_pagination, "pymupdf", None)
+    assert fast == findings()
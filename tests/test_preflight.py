@@ -0,0 +1,133 @@
+"""Tests for tools/preflight.py."""
+
+from pathlib import Path
+
+import pytest
+
+pymupdf = pytest.importorskip("pymupdf")
+pdfplumber = pytest.importorskip("pdfplumber")
+
+from tools import preflight
+from tools.preflight import PreflightChecker
+
+WORDS = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit"]
+
+
+@pytest.fixture
+def justified_pdf(tmp_path):
+    """PDF whose words are placed one by one, so word gaps are positioned, not space glyphs.
+
+    Every line has a wide gap at the same x, which preflight reports as a river,
+    and the paragraph ends on a single-word line (a runt).
+    """
+    path = tmp_path / "justified.pdf"
+    doc = pymupdf.open()
+    for _ in range(2):
+        page = doc.new_page(width=420, height=600)
+        y = 60
+        for i in range(20):
+            x = 40
+            for j in range(6):
+                word = WORDS[(i + j) % len(WORDS)]
+                page.insert_text((x, y), word, fontsize=10)
+                x += pymupdf.get_text_length(word, fontsize=10)
+                # Aligned wide gap after the third word, normal gaps elsewhere
+                x = 210 if j == 2 else x + 4 + (i % 3)
+            y += 14
+        page.insert_text((40, y), "end", fontsize=10)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _issues(pdf_path):
+    checker = PreflightChecker(str(pdf_path), workers=1, use_cache=False)
+    return [preflight._issue_to_dict(i) for i in checker.check_all()]
+
+
+def test_pymupdf_matches_pdfplumber(justified_pdf, monkeypatch):
+    fast = _issues(justified_pdf)
+    assert any(issue["type"] == "river" for issue in fast)
+
+    monkeypatch.setattr(preflight, "pymupdf", None)
+    assert fast == _issues(justified_pdf)
+
+
+
+def test_pymupdf_char_boxes_match_pdfplumber(tmp_path):
+    font_file = Path(__file__).resolve().parent.parent / "fonts" / "CrimsonText-Regular.ttf"
+    path = tmp_path / "embedded.pdf"
+    doc = pymupdf.open()
+    page = doc.new_page(width=420, height=600)
+    writer = pymupdf.TextWriter(page.rect)
+    writer.append((40, 80), " ".join(WORDS), font=pymupdf.Font(fontfile=str(font_file)), fontsize=10)
+    writer.write_text(page)
+    doc.save(path)
+    doc.close()
+
+    with pymupdf.open(str(path)) as doc:
+        mupdf = preflight._PyMuPDFPage(doc[0]).chars
+    with pdfplumber.open(str(path)) as pdf:
+        plumber = pdf.pages[0].chars
+
+    assert [c['text'] for c in mupdf] == [c['text'] for c in plumber]
+    for a, b in zip(mupdf, plumber):
+        assert (a['top'], a['bottom']) == pytest.approx((b['top'], b['bottom']), abs=0.01)
+
+def _jpeg_with_jfif_density(path, unit, density):
+    """Save a small JPEG, then rewrite its JFIF APP0 unit and density fields."""
+    Image = pytest.importorskip("PIL.Image")
+    Image.new("CMYK", (8, 8)).save(path, "JPEG", dpi=(1, 1))
+    data = bytearray(path.read_bytes())
+    app0 = data.index(b"JFIF\x00")
+    data[app0 + 7] = unit
+    data[app0 + 8:app0 + 12] = density.to_bytes(2, "big") * 2
+    path.write_bytes(bytes(data))
+    return path
+
+
+@pytest.mark.parametrize("unit, density", [(0, 1), (1, 300), (1, 72), (2, 120), (2, 20)])
+def test_jpeg_header_matches_pillow(tmp_path, unit, density):
+    Image = pytest.importorskip("PIL.Image")
+    path = _jpeg_with_jfif_density(tmp_path / "img.jpg", unit, density)
+
+    info, mode, size = preflight._read_image_header(path)
+    with Image.open(path) as img:
+        assert (info.get("dpi"), mode, size) == (img.info.get("dpi"), img.mode, img.size)
+
+
+def test_dpcm_jpeg_above_300_dpi_is_not_low_resolution(tmp_path, justified_pdf):
+    images = tmp_path / "images"
+    images.mkdir()
+    # 120 dots/cm = 304.8 DPI
+    _jpeg_with_jfif_density(images / "photo.jpg", 2, 120)
+
+    checker = PreflightChecker(str(justified_pdf), str(images), workers=1, use_cache=False)
+    assert not [i for i in checker.check_all() if i.type == "low_resolution"]
+
+
+def test_tiff_issues_are_cached(tmp_path, justified_pdf, monkeypatch):
+    Image = pytest.importorskip("PIL.Image")
+    monkeypatch.setattr(preflight, "CACHE_DIR", tmp_path / "cache")
+    images = tmp_path / "images"
+    images.mkdir()
+    # Pillow reports a TIFF's dpi as IFDRationals
+    Image.new("RGB", (8, 8)).save(images / "scan.tif", dpi=(150, 150))
+
+    def run():
+        checker = PreflightChecker(str(justified_pdf), str(images), workers=1)
+        return [preflight._issue_to_dict(i) for i in checker.check_all()]
+
+    fresh = run()
+    low = [i for i in fresh if i["type"] == "low_resolution"]
+    assert low and low[0]["details"]["dpi"] == [150.0, 150.0]
+    assert run() == fresh
+    assert not list((tmp_path / "cache").glob("*.tmp"))
+
+
+def test_cache_store_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    monkeypatch.setattr(preflight, "CACHE_DIR", tmp_path)
+    issue = preflight.Issue("x", "here", preflight.Severity.INFO, "d", {"bad": object()})
+
+    preflight._cache_store("key", 1, [issue])
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,16 @@
+"""Tests for styles.load."""
+
+import styles
+from typography import get_typography_system
+
+
+def test_load_with_typography_starts_with_typography_css():
+    css = styles.load(typography="playfair-lora:relaxed")
+    expected = get_typography_system("playfair-lora", "relaxed").to_css_variables()
+    assert css.startswith(expected)
+
+
+def test_load_with_typography_defaults_to_normal_density():
+    css = styles.load(typography="playfair-lora")
+    expected = get_typography_system("playfair-lora", "normal").to_css_variables()
+    assert css.startswith(expected)
@@ -0,0 +1,63 @@
+"""Tests for typography's x-height extraction."""
+
+import os
+import sys
+import types
+
+import pytest
+
+import typography
+
+
+def _metrics(*families):
+    return {
+        f.lower(): types.SimpleNamespace(
+            family_name=f, file_path=f"/elsewhere/{f.replace(' ', '')}-Regular.ttf", x_height_ratio=0.5)
+        for f in families
+    }
+
+
+@pytest.fixture
+def fonts_dir(tmp_path, monkeypatch):
+    """Bundled fonts dir with two families and a newer metrics sidecar.
+
+    font_metrics needs fontTools, so a stand-in module records whether the
+    TTFs were parsed and serves `cached` as the sidecar's contents.
+    """
+    fonts = tmp_path / "fonts"
+    fonts.mkdir()
+    for name in ("Lora-Variable.ttf", "CrimsonText-Regular.ttf", "CrimsonText-Bold.ttf"):
+        (fonts / name).write_bytes(b"")
+    cache_file = fonts / "metrics_cache.json"
+    cache_file.write_text("{}")
+    newer = max(f.stat().st_mtime for f in fonts.iterdir()) + 10
+    os.utime(cache_file, (newer, newer))
+
+    fake = types.ModuleType("font_metrics")
+    fake.CACHE_FILE = cache_file
+    fake.cached = {}
+    fake.extracted = []
+    fake.load_metrics_cache = lambda: fake.cached
+    fake.extract_all_fonts = lambda d: fake.extracted.append(d) or _metrics("Lora", "Crimson Text")
+    monkeypatch.setitem(sys.modules, "font_metrics", fake)
+    monkeypatch.setattr(typography, "_FONTS_DIR", fonts)
+    typography._load_x_heights.cache_clear()
+    yield fonts, fake
+    typography._load_x_heights.cache_clear()
+
+
+def test_sidecar_covering_every_font_is_reused(fonts_dir):
+    fonts, fake = fonts_dir
+    fake.cached = _metrics("Lora", "Crimson Text")
+
+    assert typography._load_x_heights(fonts) == (("Crimson Text", 0.5), ("Lora", 0.5))
+    assert fake.extracted == []
+
+
+def test_sidecar_missing_a_font_is_not_trusted(fonts_dir):
+    # What get_font_metrics() leaves behind after caching a single font
+    fonts, fake = fonts_dir
+    fake.cached = _metrics("Lora")
+
+    assert typography._load_x_heights(fonts) == (("Crimson Text", 0.5), ("Lora", 0.5))
+    assert fake.extracted == [fonts]
@@ -0,0 +1,39 @@
+"""Tests for watch.LiveBuilder."""
+
+import pytest
+
+pytest.importorskip("watchdog")
+
+import watch
+
+RELOAD_SCRIPT = watch._RELOAD_SCRIPT.decode("utf-8")
+
+
+@pytest.fixture
+def builder(tmp_path):
+    content = tmp_path / "content"
+    content.mkdir()
+    (content / "Content.md").write_text("# Chapter\n\nHello.\n")
+    output = tmp_path / "output"
+    output.mkdir()
+    b = watch.LiveBuilder({"slug": "book", "title": "Book"}, content, output)
+    b.rebuild()
+    return b
+
+
+def test_unchanged_rebuild_skips_the_write(builder, capsys):
+    builder.rebuild()
+    assert "Unchanged: book.html" in capsys.readouterr().out
+
+
+def test_rebuild_restores_html_rewritten_by_something_else(builder):
+    # As `cli preview` does: same path, no reload script
+    builder.html_path.write_text("<html><body>preview</body></html>")
+    builder.rebuild()
+    assert RELOAD_SCRIPT in builder.html_path.read_text()
+
+
+def test_rebuild_restores_deleted_html(builder):
+    builder.html_path.unlink()
+    builder.rebuild()
+    assert RELOAD_SCRIPT in builder.html_path.read_text()
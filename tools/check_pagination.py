@@ -9,7 +9,7 @@ Detects typesetting issues:
 - Excessive whitespace (> 30% empty pages)
 
 Usage:
-    python3 check_pagination.py <pdf_path> [--json] [--markdown] [--fix-css <output.css>]
+    python3 check_pagination.py <pdf_path> [--json] [--markdown] [--fix-css <output.css>] [--pages FIRST-LAST]
 
 Exit codes:
     0 - No issues found
@@ -20,16 +20,50 @@ Exit codes:
 
 import argparse
 import json
+import os
+import re
 import sys
-from dataclasses import dataclass, field
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from enum import Enum
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Tuple, Union
+
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
 
 try:
     import pdfplumber
 except ImportError:
-    print("Error: pdfplumber not installed. Run: pip install pdfplumber", file=sys.stderr)
+    pdfplumber = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    from tools.pymupdf_chars import chars_from_pymupdf_page
+except ImportError:
+    # Run as a script, so tools/ itself is on sys.path
+    from pymupdf_chars import chars_from_pymupdf_page
+
+if pymupdf is None and pdfplumber is None:
+    print("Error: PyMuPDF not installed. Run: pip install pymupdf", file=sys.stderr)
     sys.exit(3)
 
 
@@ -39,17 +73,47 @@ class Severity(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
+class StrandedHeadingDetails:
+    heading_text: str
+    following_lines: int
+    position_from_bottom: float
+
+
+@dataclass(slots=True)
+class SplitTableDetails:
+    start_page: int
+    end_page: int
+
+
+@dataclass(slots=True)
+class WhitespaceDetails:
+    empty_percentage: float
+    likely_cause: str
+    empty_height_pt: float
+
+
+@dataclass(slots=True)
+class LineCountDetails:
+    """Details for orphan and widow issues."""
+    line_count: int
+    text_preview: str
+
+
+IssueDetails = Union[StrandedHeadingDetails, SplitTableDetails, WhitespaceDetails, LineCountDetails]
+
+
+@dataclass(slots=True)
 class Issue:
     type: str
     page: int
     severity: Severity
     description: str
-    details: Dict[str, Any] = field(default_factory=dict)
+    details: Optional[IssueDetails] = None
     fix_suggestion: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Page configuration - can be initialized from BookCrafter target specs."""
     orphan_min_lines: int = 3
@@ -80,352 +144,718 @@ class Config:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class _Bounds:
+    """Config-derived page geometry, computed once per analysis run."""
+    content_top: float
+    content_bottom: float
+    content_height: float
+    danger_zone: float
+    whitespace_limit: float
+    orphan_min_lines: int
+    widow_min_lines: int
+
+    @classmethod
+    def from_config(cls, config: Config) -> '_Bounds':
+        content_top = config.margin_top
+        content_bottom = config.page_height - config.margin_bottom
+        content_height = content_bottom - content_top
+        return cls(
+            content_top=content_top,
+            content_bottom=content_bottom,
+            content_height=content_height,
+            danger_zone=content_bottom - (content_height * config.heading_danger_zone_pct),
+            whitespace_limit=content_height * config.whitespace_threshold,
+            orphan_min_lines=config.orphan_min_lines,
+            widow_min_lines=config.widow_min_lines,
+        )
+
+
+class _PyMuPDFPage:
+    """Minimal pdfplumber-compatible view (chars, vector objects) of a PyMuPDF page."""
+
+    def __init__(self, page):
+        self._page = page
+        self._chars = None
+        self._vectors = None
+
+    @property
+    def chars(self) -> List[Dict]:
+        if self._chars is None:
+            self._chars = chars_from_pymupdf_page(self._page)
+        return self._chars
+
+    def _vector_objects(self) -> Tuple[List[Dict], List[Dict]]:
+        """(rects, lines) from the page's path items; Bezier curves are left out."""
+        if self._vectors is None:
+            rects, lines = [], []
+            for drawing in self._page.get_drawings():
+                items = drawing["items"]
+                segments = [(item[1], item[2]) for item in items if item[0] == "l"]
+                if drawing.get("closePath") and items and items[0][0] == "l":
+                    segments.append((items[-1][-1], items[0][1]))
+                for p1, p2 in segments:
+                    lines.append({'x0': min(p1.x, p2.x), 'x1': max(p1.x, p2.x),
+                                  'top': min(p1.y, p2.y), 'bottom': max(p1.y, p2.y)})
+                for item in items:
+                    if item[0] in ("re", "qu"):
+                        r = item[1].rect if item[0] == "qu" else item[1]
+                        rects.append({'x0': r.x0, 'x1': r.x1, 'top': r.y0, 'bottom': r.y1})
+            self._vectors = rects, lines
+        return self._vectors
+
+    @property
+    def rects(self) -> List[Dict]:
+        return self._vector_objects()[0]
+
+    @property
+    def lines(self) -> List[Dict]:
+        return self._vector_objects()[1]
+
+    curves = ()
+
+    def flush_cache(self):
+        self._chars = None
+        self._vectors = None
+
+
+# Vector objects thinner than this (pt) are rules rather than boxes, and rule
+# ends or row lines this close together are treated as aligned
+_RULE_TOLERANCE = 2.0
+
+
+def _merge_rules(rules) -> List[Tuple[float, float, float]]:
+    """Join (pos, start, end) rules at the same rounded pos that touch or overlap."""
+    by_pos = defaultdict(list)
+    for pos, start, end in rules:
+        by_pos[round(pos)].append((start, end))
+
+    merged = []
+    for pos in sorted(by_pos):
+        spans = sorted(by_pos[pos])
+        start, end = spans[0]
+        for s, e in spans[1:]:
+            if s > end + _RULE_TOLERANCE:
+                merged.append((pos, start, end))
+                start = s
+            end = max(end, e)
+        merged.append((pos, start, end))
+    return merged
+
+
+def _curve_edges(curve) -> List[Dict]:
+    """Straight segments of a pdfplumber curve's path; Bezier segments are dropped."""
+    edges = []
+    start = current = None
+    for op in curve.get('path') or ():
+        if op[0] == 'm':
+            start = current = op[1]
+            continue
+        end = start if op[0] == 'h' else op[-1]
+        if op[0] in ('l', 'h') and current is not None and end is not None:
+            edges.append({'x0': min(current[0], end[0]), 'x1': max(current[0], end[0]),
+                          'top': min(current[1], end[1]), 'bottom': max(current[1], end[1])})
+        current = end
+    return edges
+
+
+def _quick_table_bbox(page) -> Optional[Tuple[float, float, float, float]]:
+    """Union bbox (x0, top, x1, bottom) of the page's ruled grids, or None.
+
+    Much cheaper than find_tables(): the detectors only need to know whether
+    a table touches the top or bottom of the content area. A grid is 3 or
+    more row rules over roughly the same x-span, crossed by a vertical rule
+    that runs from one row to another. Cell rects count as their four edges
+    and only the straight edges of curves are used, so lone horizontal rules
+    and curved decorations never make a grid.
+    """
+    rects, lines, curves = page.rects, page.lines, page.curves
+    # Two stacked cells are the fewest objects that can form a grid
+    if len(rects) + len(lines) + len(curves) < 2:
+        return None
+
+    horizontals = []  # (y, x0, x1)
+    verticals = []    # (x, top, bottom)
+    for objs in (rects, lines, (e for c in curves for e in _curve_edges(c))):
+        for r in objs:
+            x0, top, x1, bottom = r['x0'], r['top'], r['x1'], r['bottom']
+            if bottom - top <= _RULE_TOLERANCE:
+                horizontals.append(((top + bottom) / 2, x0, x1))
+            elif x1 - x0 <= _RULE_TOLERANCE:
+                verticals.append(((x0 + x1) / 2, top, bottom))
+            else:
+                horizontals += [(top, x0, x1), (bottom, x0, x1)]
+                verticals += [(x0, top, bottom), (x1, top, bottom)]
+
+    if len(horizontals) < 3 or not verticals:
+        return None
+
+    # Cluster the merged row lines by x-span
+    grids = []
+    for y, x0, x1 in _merge_rules(horizontals):
+        for gx0, gx1, rows in grids:
+            if abs(x0 - gx0) <= _RULE_TOLERANCE and abs(x1 - gx1) <= _RULE_TOLERANCE:
+                rows.append(y)
+                break
+        else:
+            grids.append((x0, x1, [y]))
+
+    bbox = None
+    for x0, x1, rows in grids:
+        if len(rows) < 3:
+            continue
+        crossed = any(
+            x0 - _RULE_TOLERANCE <= x <= x1 + _RULE_TOLERANCE
+            and sum(top - _RULE_TOLERANCE <= y <= bottom + _RULE_TOLERANCE for y in rows) >= 2
+            for x, top, bottom in verticals
+        )
+        if not crossed:
+            continue
+        grid = (x0, min(rows), x1, max(rows))
+        if bbox is None:
+            bbox = grid
+        else:
+            bbox = (min(bbox[0], grid[0]), min(bbox[1], grid[1]),
+                    max(bbox[2], grid[2]), max(bbox[3], grid[3]))
+    return bbox
+
+
+def _segment_line_starts(rounded_tops):
+    """Indices where a new line starts in sorted, rounded char tops.
+
+    Compiled with Numba when it is installed; see _group_chars_into_lines_np.
+    """
+    n = rounded_tops.shape[0]
+    starts = np.empty(n, np.int64)
+    starts[0] = 0
+    k = 1
+    anchor = rounded_tops[0]
+    for i in range(1, n):
+        if rounded_tops[i] - anchor >= 5:  # sorted, so no abs() needed
+            starts[k] = i
+            k += 1
+            anchor = rounded_tops[i]
+    return starts[:k]
+
+
+if njit is not None:
+    _segment_line_starts = njit(cache=True)(_segment_line_starts)
+
+
+def _page_text_y_extent(chars) -> tuple:
+    """Return (min top, max bottom) over a page's chars in one pass, without grouping."""
+    min_top = float('inf')
+    max_bottom = float('-inf')
+    for c in chars:
+        if c['top'] < min_top:
+            min_top = c['top']
+        if c['bottom'] > max_bottom:
+            max_bottom = c['bottom']
+    return min_top, max_bottom
+
+
+class _PageData:
+    """Per-page extraction results; chars are grouped into lines on first use.
+
+    Chars are read from the page exactly once and dropped as soon as they are
+    grouped, so at most the current page and the lookahead hold raw chars.
+    """
+
+    def __init__(self, chars, table_bbox, group_lines):
+        self._chars = chars
+        self.has_text = bool(chars)
+        self.table_bbox = table_bbox
+        # A line's top/bottom is the min/max over its chars, so this extent
+        # bounds every line and lets detectors rule a page out before grouping
+        self.min_top, self.max_bottom = _page_text_y_extent(chars)
+        self._group_lines = group_lines
+        self._lines = None
+
+    @property
+    def lines(self) -> List[Dict]:
+        if self._lines is None:
+            self._lines = self._group_lines(self._chars)
+            self._chars = None
+        return self._lines
+
+
+# Typical section heading keywords
+_HEADING_RE = re.compile(r'chapter|part|appendix|section|the |how |why |what ', re.IGNORECASE)
+
+
+def _is_heading(line: Dict) -> bool:
+    """Check if line is a heading based on font characteristics."""
+    # Larger size or bold font indicates heading (size first: no lower() needed)
+    return line.get('size', 0) > 13 or 'bold' in line.get('fontname', '').lower()
+
+
+def _is_section_heading(line: Dict) -> bool:
+    """Check if line is a real section heading (h2/h3/h4), not decorative text."""
+    # Must have bold font or larger size
+    if not (line.get('size', 0) > 12 or 'bold' in line.get('fontname', '').lower()):
+        return False
+
+    text = line.get('text', '').strip()
+
+    # Filter out decorative/cover elements:
+    # - Too short (< 3 chars)
+    # - ALL CAPS (decorative text like "PUBLISHER NAME")
+    # - Single words that are likely labels or running header fragments
+    if len(text) < 3:
+        return False
+    if len(text) < 30 and text.isupper():
+        return False
+    # Require at least 2 words (filters out "Biggest", "The", etc.);
+    # text is stripped, so an inner space settles it without split()
+    if ' ' not in text and len(text.split()) < 2:
+        return False
+
+    # Should look like a heading:
+    # - Starts with capital letter or number
+    # - Contains actual words (not just symbols)
+    # - Common patterns: "Chapter X", "Part X", "The ...", section titles
+    first = text[0]
+    if not ('A' <= first <= 'Z' or '0' <= first <= '9' or first.isupper() or first.isdigit()):
+        return False
+
+    # Reasonable length title (3-80 chars, not a paragraph), or
+    # typical section heading keywords (one compiled scan)
+    return 3 <= len(text) <= 80 or _HEADING_RE.search(text) is not None
+
+
+def _detect_stranded_headings(page_num: int, page: _PageData, bounds: _Bounds) -> List[Issue]:
+    """Detect headings at page bottom without following content."""
+    issues = []
+
+    content_bottom = bounds.content_bottom
+    danger_zone = bounds.danger_zone
+
+    # No text reaches the danger zone, so no heading can be stranded
+    if page.max_bottom <= danger_zone:
+        return issues
+
+    lines = page.lines
+    n = len(lines)
+    body_flags = None  # per line: non-empty and not a heading
+
+    for i, line in enumerate(lines):
+        # Use stricter section heading check
+        if line['bottom'] > danger_zone and _is_section_heading(line):
+            if body_flags is None:
+                body_flags = [bool(ln['text'].strip()) and not _is_heading(ln) for ln in lines]
+
+            # Check for substantial content after heading on same page;
+            # two body lines settle it, so stop counting there
+            following = 0
+            for j in range(i + 1, n):
+                if body_flags[j]:
+                    following += 1
+                    if following >= 2:
+                        break
+
+            if following < 2:
+                heading_text = line['text'].strip()[:50]
+                issues.append(Issue(
+                    type="stranded_heading",
+                    page=page_num + 1,
+                    severity=Severity.ERROR,
+                    description=f"Heading at page bottom: \"{heading_text}...\"",
+                    details=StrandedHeadingDetails(
+                        heading_text=line['text'].strip(),
+                        following_lines=following,
+                        position_from_bottom=round(content_bottom - line['bottom'], 1)
+                    ),
+                    fix_suggestion="Add page-break-before to this heading or adjust preceding content"
+                ))
+
+    return issues
+
+
+def _detect_split_tables(page_num: int, page: _PageData, next_page: Optional[_PageData],
+                         bounds: _Bounds) -> List[Issue]:
+    """Detect tables split across pages (next_page is None on the last page)."""
+    issues = []
+    content_bottom = bounds.content_bottom
+
+    bbox = page.table_bbox  # (x0, top, x1, bottom)
+    # Check if table extends to bottom of content area (within 30pt)
+    if bbox is not None and bbox[3] > content_bottom - 30 and next_page is not None:
+        # Table at top of next page?
+        next_bbox = next_page.table_bbox
+        if next_bbox is not None and next_bbox[1] < bounds.content_top + 50:
+            issues.append(Issue(
+                type="split_table",
+                page=page_num + 1,
+                severity=Severity.WARNING,
+                description=f"Table split across pages {page_num + 1}-{page_num + 2}",
+                details=SplitTableDetails(
+                    start_page=page_num + 1,
+                    end_page=page_num + 2
+                ),
+                fix_suggestion="OK if headers repeat; otherwise use break-inside: avoid or split manually"
+            ))
+
+    return issues
+
+
+def _detect_excessive_whitespace(page_num: int, page: _PageData, bounds: _Bounds) -> List[Issue]:
+    """Detect pages with too much empty space."""
+    issues = []
+
+    content_top = bounds.content_top
+    content_bottom = bounds.content_bottom
+    content_height = bounds.content_height
+
+    has_text = page.has_text
+    bbox = page.table_bbox
+
+    if not has_text and bbox is None:
+        # Possibly intentionally blank or cover page
+        return issues
+
+    # Calculate vertical extent of content (no line grouping needed)
+    min_y = content_bottom
+    max_y = content_top
+
+    if has_text:
+        min_y = min(min_y, page.min_top)
+        max_y = max(max_y, page.max_bottom)
+
+    if bbox is not None:
+        min_y = min(min_y, bbox[1])
+        max_y = max(max_y, bbox[3])
+
+    # Calculate empty space at bottom
+    empty_at_bottom = content_bottom - max_y
+
+    # Only flag if significant empty space at bottom (not top, which is normal for chapters)
+    if empty_at_bottom > bounds.whitespace_limit:
+        empty_pct = round((empty_at_bottom / content_height) * 100, 1)
+
+        # Analyze likely cause
+        cause = "page_break_rule"
+        if has_text and _is_heading(page.lines[-1]):
+            cause = "heading_pushed_to_next_page"
+        if bbox is not None:
+            cause = "table_avoid_split"
+
+        issues.append(Issue(
+            type="excessive_whitespace",
+            page=page_num + 1,
+            severity=Severity.WARNING,
+            description=f"Page has {empty_pct}% empty space at bottom",
+            details=WhitespaceDetails(
+                empty_percentage=empty_pct,
+                likely_cause=cause,
+                empty_height_pt=round(empty_at_bottom, 1)
+            ),
+            fix_suggestion=_get_whitespace_fix(cause)
+        ))
+
+    return issues
+
+
+_WHITESPACE_FIXES = {
+    "heading_pushed_to_next_page": "Adjust content before heading to fill space",
+    "table_avoid_split": "Consider splitting table or adjusting preceding content",
+    "page_break_rule": "Review page-break-before rules"
+}
+
+
+def _get_whitespace_fix(cause: str) -> str:
+    """Get fix suggestion based on whitespace cause."""
+    return _WHITESPACE_FIXES.get(cause, "Review page break and content flow")
+
+
+def _detect_orphans_widows(page_num: int, page: _PageData, next_page: Optional[_PageData],
+                           bounds: _Bounds) -> List[Issue]:
+    """Detect orphan and widow lines (next_page is None on the last page)."""
+    issues = []
+
+    content_top = bounds.content_top
+    content_bottom = bounds.content_bottom
+
+    # Orphans need a line near the top, widows a line near the bottom
+    may_orphan = page.min_top < content_top + 40
+    may_widow = next_page is not None and page.max_bottom > content_bottom - 40
+    if not (may_orphan or may_widow):
+        return issues
+
+    lines = page.lines
+    if len(lines) < 2:
+        return issues
+
+    # Filter to content area lines only
+    area_top = content_top - 10
+    area_bottom = content_bottom + 10
+    content_lines = [ln for ln in lines
+                   if ln['top'] >= area_top and ln['bottom'] <= area_bottom]
+
+    if not content_lines:
+        return issues
+
+    # Check for orphans (continuation at page top)
+    orphan_band = content_top + 40
+    first_lines = [ln for ln in content_lines if ln['top'] < orphan_band]
+    if 0 < len(first_lines) < bounds.orphan_min_lines:
+        first_line = first_lines[0]
+        text = first_line['text'].strip()
+        # Check if looks like paragraph continuation (starts lowercase, no indent)
+        if text and text[0].islower():
+            issues.append(Issue(
+                type="orphan",
+                page=page_num + 1,
+                severity=Severity.WARNING,
+                description=f"Possible orphan: {len(first_lines)} line(s) at page top",
+                details=LineCountDetails(
+                    line_count=len(first_lines),
+                    text_preview=text[:60]
+                ),
+                fix_suggestion="Increase orphans CSS value or adjust preceding content"
+            ))
+
+    # Check for widows (continuation to next page)
+    if next_page is not None:
+        widow_band = content_bottom - 40
+        last_lines = [ln for ln in content_lines if ln['bottom'] > widow_band]
+        if 0 < len(last_lines) < bounds.widow_min_lines:
+            # Check if next page starts with paragraph continuation
+            next_lines = next_page.lines
+            if next_lines:
+                next_first = next_lines[0]['text'].strip()
+                if next_first and next_first[0].islower():
+                    issues.append(Issue(
+                        type="widow",
+                        page=page_num + 1,
+                        severity=Severity.WARNING,
+                        description=f"Possible widow: {len(last_lines)} line(s) at page bottom",
+                        details=LineCountDetails(
+                            line_count=len(last_lines),
+                            text_preview=last_lines[-1]['text'].strip()[:60]
+                        ),
+                        fix_suggestion="Increase widows CSS value or add page-break-before"
+                    ))
+
+    return issues
+
+
 class PaginationChecker:
-    def __init__(self, pdf_path: str, config: Optional[Config] = None):
+    # Pages per worker task when analyzing in parallel
+    CHUNK_PAGES = 32
+
+    def __init__(self, pdf_path: str, config: Optional[Config] = None, workers: Optional[int] = None,
+                 page_range: Optional[range] = None):
         self.pdf_path = Path(pdf_path)
         self.config = config or Config()
+        self.workers = workers or min(os.cpu_count() or 1, 8)
+        # 0-based page indices to check; pages outside it are never parsed
+        self.page_range = page_range
         self.issues: List[Issue] = []
 
     def analyze(self) -> List[Issue]:
         """Run all detection algorithms and return issues."""
         self.issues = []
 
-        with pdfplumber.open(self.pdf_path) as pdf:
-            pages = pdf.pages
-
-            # Run detectors
-            self.issues.extend(self._detect_stranded_headings(pages))
-            self.issues.extend(self._detect_split_tables(pages))
-            self.issues.extend(self._detect_excessive_whitespace(pages))
-            self.issues.extend(self._detect_orphans_widows(pages))
+        page_count = self._page_count()
+        first, last = 0, page_count
+        if self.page_range is not None:
+            first = max(first, self.page_range.start)
+            last = min(last, self.page_range.stop)
+        chunks = [(start, min(start + self.CHUNK_PAGES, last))
+                  for start in range(first, last, self.CHUNK_PAGES)]
+        workers = min(self.workers, len(chunks))
+
+        if workers > 1:
+            # Each worker opens the PDF itself; parsed documents don't pickle
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_analyze_page_range, str(self.pdf_path), self.config,
+                                       start, stop, page_count)
+                           for start, stop in chunks]
+                for future in futures:
+                    self.issues.extend(future.result())
+        elif first < last:
+            self._analyze_range(first, last, page_count)
 
         # Sort by page number
-        self.issues.sort(key=lambda x: x.page)
+        self.issues.sort(key=attrgetter("page"))
         return self.issues
 
+    def _page_count(self) -> int:
+        """Return the number of pages in the PDF."""
+        if pymupdf is not None:
+            with pymupdf.open(self.pdf_path) as doc:
+                return len(doc)
+        with pdfplumber.open(self.pdf_path) as pdf:
+            return len(pdf.pages)
+
+    def _analyze_range(self, start: int, stop: int, page_count: int) -> None:
+        """Run the detectors over pages [start, stop), adding to self.issues.
+
+        One page past the range is read as lookahead for split tables and widows.
+        """
+        end = min(stop + 1, page_count)
+        # PyMuPDF parses an order of magnitude faster than pdfplumber;
+        # pdfplumber remains as a fallback when it is not installed.
+        if pymupdf is not None:
+            with pymupdf.open(self.pdf_path) as doc:
+                pages = (_PyMuPDFPage(doc[i]) for i in range(start, end))
+                self._run_detectors(pages, page_count, start, stop)
+        else:
+            # pages= (1-based) keeps pdfplumber from building the other pages
+            with pdfplumber.open(self.pdf_path, pages=range(start + 1, end + 1)) as pdf:
+                self._run_detectors(pdf.pages, page_count, start, stop)
+
+    def _run_detectors(self, pages, page_count: int, start: int = 0, stop: Optional[int] = None) -> None:
+        """Run every detector page by page.
+
+        `pages` yields pages from index `start`; issues are reported for pages
+        before `stop`. Pages are consumed lazily: only the current page and a
+        one-page lookahead (for split tables and widows) are held in memory.
+        """
+        if stop is None:
+            stop = page_count
+
+        # Skip cover pages (first 5 and last 5 pages) for stranded headings
+        tail = page_count - 5
+
+        bounds = _Bounds.from_config(self.config)
+        page_data = self._iter_page_data(pages)
+        current = next(page_data, None)
+        page_num = start
+
+        while current is not None and page_num < stop:
+            upcoming = next(page_data, None)
+
+            if 5 <= page_num < tail:
+                self.issues.extend(_detect_stranded_headings(page_num, current, bounds))
+            self.issues.extend(_detect_split_tables(page_num, current, upcoming, bounds))
+            self.issues.extend(_detect_excessive_whitespace(page_num, current, bounds))
+            self.issues.extend(_detect_orphans_widows(page_num, current, upcoming, bounds))
+
+            current = upcoming
+            page_num += 1
+
+    def _iter_page_data(self, pages):
+        """Yield a _PageData per page, releasing each page's parse cache."""
+        for page in pages:
+            data = _PageData(page.chars, _quick_table_bbox(page), self._group_chars_into_lines)
+            page.flush_cache()
+            yield data
+
     def _group_chars_into_lines(self, chars) -> List[Dict]:
         """Group characters into lines based on Y position."""
         if not chars:
             return []
 
-        # Sort by Y position (top), then X
-        sorted_chars = sorted(chars, key=lambda c: (round(c['top'], 0), c['x0']))
+        if np is not None:
+            return self._group_chars_into_lines_np(chars)
+
+        # Bucket chars by rounded top in one pass; only the (few) distinct
+        # tops are sorted, and each bucket by X
+        buckets = defaultdict(list)
+        for char in chars:
+            buckets[round(char['top'])].append(char)
 
         lines = []
         current_line = []
         current_top = None
 
-        for char in sorted_chars:
-            char_top = round(char['top'], 0)
-            if current_top is None or abs(char_top - current_top) < 5:
-                current_line.append(char)
-                if current_top is None:
-                    current_top = char_top
-            else:
-                if current_line:
-                    lines.append(self._create_line_dict(current_line))
-                current_line = [char]
-                current_top = char_top
+        for top in sorted(buckets):
+            if current_top is not None and top - current_top >= 5:
+                lines.append(self._create_line_dict(current_line))
+                current_line = []
+                current_top = None
+            if current_top is None:
+                current_top = top
+            current_line.extend(sorted(buckets[top], key=itemgetter('x0')))
 
         if current_line:
             lines.append(self._create_line_dict(current_line))
 
         return lines
 
-    def _create_line_dict(self, chars) -> Dict:
-        """Create a line dictionary from characters."""
-        text = ''.join(c.get('text', '') for c in chars)
-        sizes = [c.get('size', 11) for c in chars if c.get('size')]
-        fontnames = [c.get('fontname', '') for c in chars if c.get('fontname')]
-
-        return {
-            'text': text,
-            'top': min(c['top'] for c in chars),
-            'bottom': max(c['bottom'] for c in chars),
-            'x0': min(c['x0'] for c in chars),
-            'x1': max(c['x1'] for c in chars),
-            'fontname': fontnames[0] if fontnames else '',
-            'size': max(sizes) if sizes else 11
-        }
-
-    def _is_heading(self, line: Dict) -> bool:
-        """Check if line is a heading based on font characteristics."""
-        fontname = line.get('fontname', '').lower()
-        size = line.get('size', 0)
-        # Larger size or bold font indicates heading
-        return 'bold' in fontname or size > 13
-
-    def _is_section_heading(self, line: Dict) -> bool:
-        """Check if line is a real section heading (h2/h3/h4), not decorative text."""
-        text = line.get('text', '').strip()
-        fontname = line.get('fontname', '').lower()
-        size = line.get('size', 0)
-
-        # Must have bold font or larger size
-        if not ('bold' in fontname or size > 12):
-            return False
-
-        # Filter out decorative/cover elements:
-        # - Too short (< 3 chars)
-        # - ALL CAPS (decorative text like "PUBLISHER NAME")
-        # - Single words that are likely labels or running header fragments
-        if len(text) < 3:
-            return False
-        if text.isupper() and len(text) < 30:
-            return False
-        # Require at least 2 words (filters out "Biggest", "The", etc.)
-        if len(text.split()) < 2:
-            return False
-
-        # Should look like a heading:
-        # - Starts with capital letter or number
-        # - Contains actual words (not just symbols)
-        # - Common patterns: "Chapter X", "Part X", "The ...", section titles
-        if not text[0].isupper() and not text[0].isdigit():
-            return False
-
-        # Typical section heading keywords
-        heading_patterns = ['chapter', 'part', 'appendix', 'section', 'the ', 'how ', 'why ', 'what ']
-        text_lower = text.lower()
-        has_heading_pattern = any(p in text_lower for p in heading_patterns)
-
-        # Or reasonable length title (3-80 chars, not a paragraph)
-        reasonable_title = 3 <= len(text) <= 80
-
-        return has_heading_pattern or reasonable_title
-
-    def _detect_stranded_headings(self, pages) -> List[Issue]:
-        """Detect headings at page bottom without following content."""
-        issues = []
-
-        content_top = self.config.margin_top
-        content_bottom = self.config.page_height - self.config.margin_bottom
-        content_height = content_bottom - content_top
-        danger_zone = content_bottom - (content_height * self.config.heading_danger_zone_pct)
-
-        # Skip cover pages (first 5 and last 5 pages)
-        skip_pages = set(range(5)) | set(range(max(0, len(pages) - 5), len(pages)))
-
-        for page_num, page in enumerate(pages):
-            if page_num in skip_pages:
-                continue
-
-            chars = page.chars
-            if not chars:
-                continue
-
-            lines = self._group_chars_into_lines(chars)
-            if not lines:
-                continue
-
-            for i, line in enumerate(lines):
-                # Use stricter section heading check
-                if self._is_section_heading(line) and line['bottom'] > danger_zone:
-                    # Check for substantial content after heading on same page
-                    following_lines = [ln for ln in lines[i+1:]
-                                      if ln['text'].strip() and not self._is_heading(ln)]
-
-                    if len(following_lines) < 2:
-                        heading_text = line['text'].strip()[:50]
-                        issues.append(Issue(
-                            type="stranded_heading",
-                            page=page_num + 1,
-                            severity=Severity.ERROR,
-                            description=f"Heading at page bottom: \"{heading_text}...\"",
-                            details={
-                                "heading_text": line['text'].strip(),
-                                "following_lines": len(following_lines),
-                                "position_from_bottom": round(content_bottom - line['bottom'], 1)
-                            },
-                            fix_suggestion="Add page-break-before to this heading or adjust preceding content"
-                        ))
-
-        return issues
-
-    def _detect_split_tables(self, pages) -> List[Issue]:
-        """Detect tables split across pages."""
-        issues = []
-        content_bottom = self.config.page_height - self.config.margin_bottom
-
-        for page_num, page in enumerate(pages):
-            tables = page.find_tables()
-
-            for table in tables:
-                if not table.bbox:
-                    continue
-
-                bbox = table.bbox  # (x0, top, x1, bottom)
-
-                # Check if table extends to bottom of content area
-                if bbox[3] > content_bottom - 30:  # Within 30pt of bottom
-                    # Check next page for table at top
-                    if page_num + 1 < len(pages):
-                        next_page = pages[page_num + 1]
-                        next_tables = next_page.find_tables()
-
-                        for next_table in next_tables:
-                            if not next_table.bbox:
-                                continue
-                            next_bbox = next_table.bbox
-
-                            # Table at top of next page?
-                            if next_bbox[1] < self.config.margin_top + 50:
-                                issues.append(Issue(
-                                    type="split_table",
-                                    page=page_num + 1,
-                                    severity=Severity.WARNING,
-                                    description=f"Table split across pages {page_num + 1}-{page_num + 2}",
-                                    details={
-                                        "start_page": page_num + 1,
-                                        "end_page": page_num + 2
-                                    },
-                                    fix_suggestion="OK if headers repeat; otherwise use break-inside: avoid or split manually"
-                                ))
-                                break
-
-        return issues
-
-    def _detect_excessive_whitespace(self, pages) -> List[Issue]:
-        """Detect pages with too much empty space."""
-        issues = []
-
-        content_top = self.config.margin_top
-        content_bottom = self.config.page_height - self.config.margin_bottom
-        content_height = content_bottom - content_top
-        content_width = self.config.page_width - 2 * self.config.margin_sides
-        content_height * content_width
-
-        for page_num, page in enumerate(pages):
-            chars = page.chars
-            tables = page.find_tables()
-
-            if not chars and not tables:
-                # Possibly intentionally blank or cover page
-                continue
-
-            # Calculate vertical extent of content
-            min_y = content_bottom
-            max_y = content_top
-
-            if chars:
-                lines = self._group_chars_into_lines(chars)
-                if lines:
-                    min_y = min(min_y, min(ln['top'] for ln in lines))
-                    max_y = max(max_y, max(ln['bottom'] for ln in lines))
-
-            for table in tables:
-                if table.bbox:
-                    min_y = min(min_y, table.bbox[1])
-                    max_y = max(max_y, table.bbox[3])
-
-            # Calculate empty space at bottom
-            max_y - min_y
-            empty_at_bottom = content_bottom - max_y
-
-            # Only flag if significant empty space at bottom (not top, which is normal for chapters)
-            if empty_at_bottom > content_height * self.config.whitespace_threshold:
-                empty_pct = round((empty_at_bottom / content_height) * 100, 1)
-
-                # Analyze likely cause
-                cause = "page_break_rule"
-                if chars:
-                    lines = self._group_chars_into_lines(chars)
-                    if lines and self._is_heading(lines[-1]):
-                        cause = "heading_pushed_to_next_page"
-                if tables:
-                    cause = "table_avoid_split"
+    def _group_chars_into_lines_np(self, chars) -> List[Dict]:
+        """NumPy implementation of _group_chars_into_lines (same grouping rule)."""
+        n = len(chars)
+        tops = np.fromiter((c['top'] for c in chars), dtype=np.float64, count=n)
+        bottoms = np.fromiter((c['bottom'] for c in chars), dtype=np.float64, count=n)
+        x0s = np.fromiter((c['x0'] for c in chars), dtype=np.float64, count=n)
+        x1s = np.fromiter((c['x1'] for c in chars), dtype=np.float64, count=n)
+        sizes = np.fromiter((c.get('size') or -np.inf for c in chars), dtype=np.float64, count=n)
+
+        # Sort by rounded top, then x0 (lexsort is stable, like sorted())
+        rounded = np.round(tops)
+        order = np.lexsort((x0s, rounded))
+        rounded = rounded[order]
+
+        # A line extends until the rounded top reaches its first char's top + 5
+        if njit is not None:
+            starts = _segment_line_starts(rounded).tolist()
+        else:
+            # searchsorted finds each boundary in C, so Python loops per line, not per char
+            starts = []
+            start = 0
+            while start < n:
+                starts.append(start)
+                start = int(np.searchsorted(rounded, rounded[start] + 5, side='left'))
+        ends = starts[1:] + [n]
+
+        line_tops = np.minimum.reduceat(tops[order], starts).tolist()
+        line_bottoms = np.maximum.reduceat(bottoms[order], starts).tolist()
+        line_x0s = np.minimum.reduceat(x0s[order], starts).tolist()
+        line_x1s = np.maximum.reduceat(x1s[order], starts).tolist()
+        line_sizes = np.maximum.reduceat(sizes[order], starts).tolist()
+
+        ordered = [chars[i] for i in order.tolist()]
+        lines = []
+        for k, (s, e) in enumerate(zip(starts, ends)):
+            segment = ordered[s:e]
+            size = line_sizes[k]
+            lines.append({
+                'text': ''.join([c.get('text', '') for c in segment]),
+                'top': line_tops[k],
+                'bottom': line_bottoms[k],
+                'x0': line_x0s[k],
+                'x1': line_x1s[k],
+                'fontname': next((c['fontname'] for c in segment if c.get('fontname')), ''),
+                'size': size if size != -np.inf else 11
+            })
 
-                issues.append(Issue(
-                    type="excessive_whitespace",
-                    page=page_num + 1,
-                    severity=Severity.WARNING,
-                    description=f"Page has {empty_pct}% empty space at bottom",
-                    details={
-                        "empty_percentage": empty_pct,
-                        "likely_cause": cause,
-                        "empty_height_pt": round(empty_at_bottom, 1)
-                    },
-                    fix_suggestion=self._get_whitespace_fix(cause)
-                ))
+        return lines
 
-        return issues
+    def _create_line_dict(self, chars) -> Dict:
+        """Create a line dictionary from characters in a single pass."""
+        first = chars[0]
+        top, bottom, x0, x1 = first['top'], first['bottom'], first['x0'], first['x1']
+        size = None
+        fontname = ''
+        texts = []
+
+        for c in chars:
+            if c['top'] < top:
+                top = c['top']
+            if c['bottom'] > bottom:
+                bottom = c['bottom']
+            if c['x0'] < x0:
+                x0 = c['x0']
+            if c['x1'] > x1:
+                x1 = c['x1']
+            char_size = c.get('size')
+            if char_size and (size is None or char_size > size):
+                size = char_size
+            if not fontname:
+                fontname = c.get('fontname') or ''
+            texts.append(c.get('text', ''))
 
-    def _get_whitespace_fix(self, cause: str) -> str:
-        """Get fix suggestion based on whitespace cause."""
-        fixes = {
-            "heading_pushed_to_next_page": "Adjust content before heading to fill space",
-            "table_avoid_split": "Consider splitting table or adjusting preceding content",
-            "page_break_rule": "Review page-break-before rules"
+        return {
+            'text': ''.join(texts),
+            'top': top,
+            'bottom': bottom,
+            'x0': x0,
+            'x1': x1,
+            'fontname': fontname,
+            'size': size if size is not None else 11
         }
-        return fixes.get(cause, "Review page break and content flow")
-
-    def _detect_orphans_widows(self, pages) -> List[Issue]:
-        """Detect orphan and widow lines."""
-        issues = []
-
-        content_top = self.config.margin_top
-        content_bottom = self.config.page_height - self.config.margin_bottom
-
-        for page_num, page in enumerate(pages):
-            chars = page.chars
-            if not chars:
-                continue
-
-            lines = self._group_chars_into_lines(chars)
-            if len(lines) < 2:
-                continue
-
-            # Filter to content area lines only
-            content_lines = [ln for ln in lines
-                           if ln['top'] >= content_top - 10 and ln['bottom'] <= content_bottom + 10]
-
-            if not content_lines:
-                continue
-
-            # Check for orphans (continuation at page top)
-            first_lines = [ln for ln in content_lines if ln['top'] < content_top + 40]
-            if 0 < len(first_lines) < self.config.orphan_min_lines:
-                first_line = first_lines[0]
-                text = first_line['text'].strip()
-                # Check if looks like paragraph continuation (starts lowercase, no indent)
-                if text and text[0].islower():
-                    issues.append(Issue(
-                        type="orphan",
-                        page=page_num + 1,
-                        severity=Severity.WARNING,
-                        description=f"Possible orphan: {len(first_lines)} line(s) at page top",
-                        details={
-                            "line_count": len(first_lines),
-                            "text_preview": text[:60]
-                        },
-                        fix_suggestion="Increase orphans CSS value or adjust preceding content"
-                    ))
-
-            # Check for widows (continuation to next page)
-            if page_num + 1 < len(pages):
-                last_lines = [ln for ln in content_lines if ln['bottom'] > content_bottom - 40]
-                if 0 < len(last_lines) < self.config.widow_min_lines:
-                    # Check if next page starts with paragraph continuation
-                    next_page = pages[page_num + 1]
-                    next_chars = next_page.chars
-                    if next_chars:
-                        next_lines = self._group_chars_into_lines(next_chars)
-                        if next_lines:
-                            next_first = next_lines[0]['text'].strip()
-                            if next_first and next_first[0].islower():
-                                issues.append(Issue(
-                                    type="widow",
-                                    page=page_num + 1,
-                                    severity=Severity.WARNING,
-                                    description=f"Possible widow: {len(last_lines)} line(s) at page bottom",
-                                    details={
-                                        "line_count": len(last_lines),
-                                        "text_preview": last_lines[-1]['text'].strip()[:60]
-                                    },
-                                    fix_suggestion="Increase widows CSS value or add page-break-before"
-                                ))
-
-        return issues
 
     def generate_report(self, format: str = "console") -> str:
         """Generate report in specified format."""
@@ -464,7 +894,7 @@ class PaginationChecker:
 
     def _report_json(self) -> str:
         """Generate JSON report."""
-        return json.dumps({
+        payload = {
             "pdf": str(self.pdf_path),
             "total_issues": len(self.issues),
             "errors": len([i for i in self.issues if i.severity == Severity.ERROR]),
@@ -475,12 +905,15 @@ class PaginationChecker:
                     "page": i.page,
                     "severity": i.severity.value,
                     "description": i.description,
-                    "details": i.details,
+                    "details": asdict(i.details) if i.details is not None else {},
                     "fix_suggestion": i.fix_suggestion
                 }
                 for i in self.issues
             ]
-        }, indent=2)
+        }
+        if orjson is not None:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(payload, indent=2)
 
     def _report_markdown(self) -> str:
         """Generate Markdown report."""
@@ -514,6 +947,13 @@ class PaginationChecker:
         return 1
 
 
+def _analyze_page_range(pdf_path: str, config: Config, start: int, stop: int, page_count: int) -> List[Issue]:
+    """Worker entry point: analyze pages [start, stop) in a subprocess."""
+    checker = PaginationChecker(pdf_path, config, workers=1)
+    checker._analyze_range(start, stop, page_count)
+    return checker.issues
+
+
 def generate_css_fixes(issues: List[Issue]) -> str:
     """Generate CSS fixes for detected issues."""
     lines = ["/* Auto-generated pagination fixes */", "/* Review and merge into style.css */", ""]
@@ -550,8 +990,8 @@ def generate_css_fixes(issues: List[Issue]) -> str:
             added_fixes.add("orphan_widow")
 
         elif issue.type == "excessive_whitespace":
-            cause = issue.details.get("likely_cause", "unknown")
-            lines.append(f"/* Page {issue.page}: {issue.details.get('empty_percentage', '?')}% empty */")
+            cause = issue.details.likely_cause
+            lines.append(f"/* Page {issue.page}: {issue.details.empty_percentage}% empty */")
             lines.append(f"/* Cause: {cause} */")
             lines.append(f"/* Suggestion: {issue.fix_suggestion} */")
             lines.append("")
@@ -576,6 +1016,8 @@ Exit codes:
     parser.add_argument("--markdown", action="store_true", help="Output as Markdown")
     parser.add_argument("--fix-css", metavar="FILE", help="Generate CSS fixes to file")
     parser.add_argument("--strict", action="store_true", help="Treat warnings as errors")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count, at most 8)")
+    parser.add_argument("--pages", metavar="FIRST-LAST", help="Only check this page range (1-based, inclusive)")
 
     args = parser.parse_args()
 
@@ -583,8 +1025,17 @@ Exit codes:
         print(f"Error: PDF not found: {args.pdf}", file=sys.stderr)
         sys.exit(3)
 
+    page_range = None
+    if args.pages:
+        try:
+            first, _, last = args.pages.partition("-")
+            page_range = range(int(first) - 1, int(last or first))
+        except ValueError:
+            print(f"Error: invalid page range: {args.pages}", file=sys.stderr)
+            sys.exit(3)
+
     try:
-        checker = PaginationChecker(args.pdf)
+        checker = PaginationChecker(args.pdf, workers=args.workers, page_range=page_range)
         issues = checker.analyze()
 
         # Generate report
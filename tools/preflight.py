@@ -10,36 +10,80 @@ Detects typography and production issues:
 - Overset text detection
 
 Usage:
-    python3 preflight.py <pdf_path> [--json] [--images-dir <path>]
+    python3 preflight.py <pdf_path> [--json] [--images-dir <path>] [--no-cache]
+
+Results are cached in ~/.cache/bookcrafter/preflight/, keyed by the PDF's
+content hash (and by the images' paths, sizes and mtimes).
 """
 
 import argparse
+import bisect
+import hashlib
 import json
+import os
+import struct
 import sys
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
 try:
     import pdfplumber
 except ImportError:
-    print("Error: pdfplumber not installed. Run: pip install pdfplumber", file=sys.stderr)
+    pdfplumber = None
+
+if pymupdf is None and pdfplumber is None:
+    print("Error: PyMuPDF not installed. Run: pip install pymupdf", file=sys.stderr)
     sys.exit(3)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 try:
     from PIL import Image
 except ImportError:
     Image = None
 
+try:
+    from tools.pymupdf_chars import TEXT_FLAGS, chars_from_pymupdf_page
+except ImportError:
+    # Run as a script, so tools/ itself is on sys.path
+    from pymupdf_chars import TEXT_FLAGS, chars_from_pymupdf_page
+
+
+class Severity(IntEnum):
+    """Issue severity; lower values are more severe and sort first."""
+    ERROR = 0
+    WARNING = 1
+    INFO = 2
 
-class Severity(Enum):
-    INFO = "info"
-    WARNING = "warning"
-    ERROR = "error"
 
+_SEVERITY_ICONS = {Severity.ERROR: "!!", Severity.WARNING: "--", Severity.INFO: "  "}
 
-@dataclass
+
+@dataclass(slots=True)
 class Issue:
     type: str
     location: str
@@ -49,40 +93,376 @@ class Issue:
     fix_suggestion: Optional[str] = None
 
 
+# On-disk result cache; bump _CACHE_SCHEMA whenever a check's output changes
+CACHE_DIR = Path.home() / ".cache" / "bookcrafter" / "preflight"
+_CACHE_SCHEMA = 5
+
+
+def _issue_to_dict(issue: Issue) -> Dict[str, Any]:
+    """Plain-dict form of an issue, as written to JSON reports and the cache."""
+    return {
+        "type": issue.type,
+        "location": issue.location,
+        # Severity is an IntEnum; reports keep the lowercase names
+        "severity": issue.severity.name.lower(),
+        "description": issue.description,
+        "details": issue.details,
+        "fix_suggestion": issue.fix_suggestion,
+    }
+
+
+def _issue_from_dict(row: Dict[str, Any]) -> Issue:
+    return Issue(**{**row, "severity": Severity[row["severity"].upper()]})
+
+
+def _cache_load(key: str, size: int) -> Optional[List[Issue]]:
+    """Return cached issues for key, or None on a miss or an unusable entry."""
+    try:
+        with open(CACHE_DIR / f"{key}.json", "rb") as f:
+            entry = json.load(f)
+        if entry["schema"] != _CACHE_SCHEMA or entry["size"] != size:
+            return None
+        return [_issue_from_dict(row) for row in entry["issues"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _cache_store(key: str, size: int, issues: List[Issue]) -> None:
+    """Write issues for key atomically; a cache that can't be written is skipped."""
+    entry = {"schema": _CACHE_SCHEMA, "size": size, "issues": [_issue_to_dict(i) for i in issues]}
+    tmp_name = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=CACHE_DIR, suffix=".tmp", delete=False) as f:
+            tmp_name = f.name
+            json.dump(entry, f)
+        os.replace(tmp_name, CACHE_DIR / f"{key}.json")
+    except (OSError, TypeError, ValueError):
+        # Unserializable details land here too; don't leave the temp file behind
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+# File extensions checked by _check_image_resolution
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.tiff', '.tif'})
+
+
+def _iter_images(root: str):
+    """Yield paths of image files under root, like rglob: a directory's own files first."""
+    subdirs = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                name = entry.name
+                dot = name.rfind('.')
+                if dot > 0 and name[dot:].lower() in IMAGE_EXTENSIONS:
+                    yield entry.path
+    for subdir in subdirs:
+        yield from _iter_images(subdir)
+
+
+# JPEG start-of-frame markers (baseline, progressive, lossless, arithmetic)
+_JPEG_SOF_MARKERS = frozenset({0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7,
+                               0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF})
+_JPEG_MODES = {1: 'L', 3: 'RGB', 4: 'CMYK'}
+_PNG_MODES = {0: 'L', 2: 'RGB', 3: 'P', 4: 'LA', 6: 'RGBA'}
+
+
+def _read_jpeg_header(f) -> Optional[tuple]:
+    """(info, mode, size) from JPEG markers up to the first scan, as Pillow reports them."""
+    info = {}
+    frame = None
+    has_exif = False
+    while True:
+        if f.read(1) != b'\xff':
+            return None
+        marker = f.read(1)
+        while marker == b'\xff':
+            marker = f.read(1)
+        if not marker:
+            return None
+        m = marker[0]
+        if m == 0xD8 or 0xD0 <= m <= 0xD7 or m == 0x01:
+            continue  # standalone markers carry no length
+        if m == 0xDA:
+            break  # start of scan: Pillow stops reading the header here
+        if m == 0xD9:
+            return None
+        length = struct.unpack('>H', f.read(2))[0] - 2
+        if m == 0xE0:
+            seg = f.read(length)
+            # JFIF density is reported as DPI for inches, and converted like
+            # Pillow does for dots per cm; unit 0 is only an aspect ratio
+            if seg[:4] == b'JFIF' and len(seg) >= 12:
+                density = struct.unpack('>HH', seg[8:12])
+                if seg[7] == 1:
+                    info['dpi'] = density
+                elif seg[7] == 2:
+                    info['dpi'] = tuple(d * 2.54 for d in density)
+        elif m == 0xE1:
+            seg = f.read(min(length, 6))
+            has_exif = has_exif or seg == b'Exif\x00\x00'
+            f.seek(length - len(seg), 1)
+        elif m in _JPEG_SOF_MARKERS:
+            seg = f.read(length)
+            height, width = struct.unpack('>HH', seg[1:5])
+            frame = seg[5], (width, height)
+        else:
+            f.seek(length, 1)
+
+    if frame is None or frame[0] not in _JPEG_MODES:
+        return None
+    if 'dpi' not in info and has_exif:
+        return None  # Pillow falls back to the EXIF resolution tags
+    return info, _JPEG_MODES[frame[0]], frame[1]
+
+
+def _read_png_header(f) -> Optional[tuple]:
+    """(info, mode, size) from the PNG chunks before the image data."""
+    length, ctype = struct.unpack('>I4s', f.read(8))
+    if ctype != b'IHDR' or length < 13:
+        return None
+    width, height, bit_depth, color_type = struct.unpack('>IIBB', f.read(10))
+    f.seek(length - 10 + 4, 1)  # rest of IHDR and its CRC
+    if color_type not in _PNG_MODES:
+        return None
+    mode = _PNG_MODES[color_type]
+    if color_type == 0 and bit_depth in (1, 16):
+        mode = '1' if bit_depth == 1 else 'I'
+
+    info = {}
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            return None
+        length, ctype = struct.unpack('>I4s', header)
+        if ctype in (b'IDAT', b'IEND'):
+            break
+        if ctype == b'pHYs' and length >= 9:
+            px, py, unit = struct.unpack('>IIB', f.read(9))
+            if unit == 1:  # pixels per meter
+                info['dpi'] = (px * 0.0254, py * 0.0254)
+            f.seek(length - 9 + 4, 1)
+        else:
+            f.seek(length + 4, 1)
+    return info, mode, (width, height)
+
+
+def _read_image_header(path: Path) -> Optional[tuple]:
+    """Read DPI, mode and size straight from a JPEG or PNG header.
+
+    Returns None for other formats and anything unusual; callers hand those
+    to Pillow instead.
+    """
+    with open(path, 'rb') as f:
+        signature = f.read(8)
+        try:
+            if signature[:2] == b'\xff\xd8':
+                f.seek(2)
+                return _read_jpeg_header(f)
+            if signature == b'\x89PNG\r\n\x1a\n':
+                return _read_png_header(f)
+        except (struct.error, IndexError):
+            pass  # truncated or malformed; let Pillow report it
+    return None
+
+
+class _SortedGaps:
+    """A line's word gaps sorted for bisection, remembering their original order."""
+
+    # Tolerance for two gaps to count as vertically aligned
+    TOLERANCE = 5
+
+    def __init__(self, gaps: List[float]):
+        self._order = sorted(range(len(gaps)), key=gaps.__getitem__)
+        self._values = [gaps[j] for j in self._order]
+
+    def _window(self, x: float) -> range:
+        # Bisect a slightly wider window, then apply the exact abs() test, so
+        # float rounding at the boundary matches a plain linear scan
+        lo = bisect.bisect_left(self._values, x - self.TOLERANCE - 1)
+        hi = bisect.bisect_right(self._values, x + self.TOLERANCE + 1)
+        return range(lo, hi)
+
+    def near(self, x: float) -> List[int]:
+        """Original indices of gaps within tolerance of x, in original order."""
+        values = self._values
+        return sorted(self._order[k] for k in self._window(x) if abs(x - values[k]) < self.TOLERANCE)
+
+    def any_near(self, x: float) -> bool:
+        values = self._values
+        return any(abs(x - values[k]) < self.TOLERANCE for k in self._window(x))
+
+
+def _river_core(gaps, offsets, tol, out_lines, out_xs):
+    """Scan flattened word gaps for rivers; returns the number of hits written.
+
+    Line i's gaps are gaps[offsets[i]:offsets[i + 1]]. Hits are written in the
+    same order as the pure-Python loops in _aligned_gaps produce them.
+    Compiled with Numba when it is installed.
+    """
+    n = 0
+    for i in range(offsets.shape[0] - 3):
+        for a in range(offsets[i], offsets[i + 1]):
+            gap1 = gaps[a]
+            for b in range(offsets[i + 1], offsets[i + 2]):
+                gap2 = gaps[b]
+                if abs(gap1 - gap2) < tol:
+                    for c in range(offsets[i + 2], offsets[i + 3]):
+                        if abs(gap2 - gaps[c]) < tol:
+                            out_lines[n] = i
+                            out_xs[n] = gap1
+                            n += 1
+                            break
+    return n
+
+
+if njit is not None:
+    _river_core = njit(cache=True)(_river_core)
+
+
+class _PyMuPDFPage:
+    """Minimal pdfplumber-compatible view (chars) of a PyMuPDF page."""
+
+    def __init__(self, page):
+        self._page = page
+        self._chars = None
+
+    @property
+    def chars(self) -> List[Dict]:
+        if self._chars is None:
+            # One text page serves both extractions. Plain text is far cheaper
+            # than rawdict, so blank and image-only pages skip building char
+            # dicts; whitespace-only chars could not produce an issue anyway.
+            textpage = self._page.get_textpage(flags=TEXT_FLAGS)
+            if textpage.extractText().strip():
+                self._chars = chars_from_pymupdf_page(self._page, textpage)
+            else:
+                self._chars = []
+        return self._chars
+
+    def close(self):
+        self._chars = None
+
+
 class PreflightChecker:
     """Comprehensive preflight checks for print production."""
 
-    def __init__(self, pdf_path: str, images_dir: str = None):
+    # Pages per worker task when checking in parallel
+    CHUNK_PAGES = 32
+
+    def __init__(self, pdf_path: str, images_dir: str = None, workers: Optional[int] = None,
+                 use_cache: bool = True):
         self.pdf_path = Path(pdf_path)
         self.images_dir = Path(images_dir) if images_dir else None
+        self.workers = workers or min(os.cpu_count() or 1, 8)
+        self.use_cache = use_cache
         self.issues: List[Issue] = []
 
     def check_all(self) -> List[Issue]:
         """Run all preflight checks."""
         self.issues = []
 
-        with pdfplumber.open(self.pdf_path) as pdf:
-            self._check_runts(pdf.pages)
-            self._check_rivers(pdf.pages)
+        if self.use_cache:
+            key, size = self._pdf_digest(), self.pdf_path.stat().st_size
+            cached = _cache_load(key, size)
+            if cached is not None:
+                self.issues = cached
+            else:
+                self._check_pdf()
+                _cache_store(key, size, self.issues)
+        else:
+            self._check_pdf()
 
-        if self.images_dir and Image:
+        if self.images_dir:
             self._check_image_resolution()
 
-        self.issues.sort(key=lambda x: (x.severity.value, x.location))
+        self.issues.sort(key=lambda x: (x.severity, x.location))
         return self.issues
 
+    def _pdf_digest(self) -> str:
+        """Content hash of the PDF, read in blocks."""
+        h = hashlib.blake2b(digest_size=16)
+        with open(self.pdf_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        return "pdf-" + h.hexdigest()
+
+    def _check_pdf(self) -> None:
+        """Run the page checks over the whole PDF, adding to self.issues."""
+        page_count = self._page_count()
+        chunks = [(start, min(start + self.CHUNK_PAGES, page_count))
+                  for start in range(0, page_count, self.CHUNK_PAGES)]
+        workers = min(self.workers, len(chunks))
+
+        if workers > 1:
+            # Each worker opens the PDF itself; parsed documents don't pickle
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_check_page_range, str(self.pdf_path), start, stop)
+                           for start, stop in chunks]
+                for future in futures:
+                    self.issues.extend(future.result())
+        else:
+            self._check_range(0, page_count)
+
+    def _page_count(self) -> int:
+        """Return the number of pages in the PDF."""
+        if pymupdf is not None:
+            with pymupdf.open(self.pdf_path) as doc:
+                return len(doc)
+        with pdfplumber.open(self.pdf_path) as pdf:
+            return len(pdf.pages)
+
+    def _check_range(self, start: int, stop: int) -> None:
+        """Run the page checks over pages [start, stop), adding to self.issues."""
+        # PyMuPDF parses an order of magnitude faster than pdfplumber;
+        # pdfplumber remains as a fallback when it is not installed.
+        if pymupdf is not None:
+            with pymupdf.open(self.pdf_path) as doc:
+                # Page views are created lazily so only one page's chars are alive
+                self._check_pages((_PyMuPDFPage(doc[i]) for i in range(start, stop)), start)
+        else:
+            with pdfplumber.open(self.pdf_path) as pdf:
+                self._check_pages(pdf.pages[start:stop], start)
+
+    def _check_pages(self, pages, start: int) -> None:
+        """Run the per-page checks, reading and grouping each page's chars exactly once."""
+        for page_num, page in enumerate(pages, start):
+            chars = page.chars
+            # Drop the page's parse cache; the local chars list is all we need
+            page.close()
+            if not chars:
+                continue
+
+            lines = self._group_chars_to_lines(chars)
+            self._check_runts(page_num, lines)
+            self._check_rivers(page_num, lines)
+
     def _group_chars_to_lines(self, chars) -> List[Dict]:
         """Group characters into lines."""
         if not chars:
             return []
 
-        sorted_chars = sorted(chars, key=lambda c: (round(c['top'], 0), c['x0']))
+        if np is not None:
+            return self._group_chars_to_lines_np(chars)
+
+        # round(x) returns an int via a fast path that round(x, 0) doesn't take;
+        # both round half to even, so the grouping is the same. Each char is
+        # rounded once and the result reused by the sort and the loop.
+        rounded = [round(c['top']) for c in chars]
+        order = sorted(range(len(chars)), key=lambda i: (rounded[i], chars[i]['x0']))
         lines = []
         current_line = []
         current_top = None
 
-        for char in sorted_chars:
-            char_top = round(char['top'], 0)
+        for i in order:
+            char = chars[i]
+            char_top = rounded[i]
             if current_top is None or abs(char_top - current_top) < 5:
                 current_line.append(char)
                 if current_top is None:
@@ -98,167 +478,278 @@ class PreflightChecker:
 
         return lines
 
+    def _group_chars_to_lines_np(self, chars) -> List[Dict]:
+        """NumPy implementation of _group_chars_to_lines (same grouping rule)."""
+        n = len(chars)
+        tops = np.fromiter((c['top'] for c in chars), dtype=np.float64, count=n)
+        bottoms = np.fromiter((c['bottom'] for c in chars), dtype=np.float64, count=n)
+        x0s = np.fromiter((c['x0'] for c in chars), dtype=np.float64, count=n)
+        x1s = np.fromiter((c['x1'] for c in chars), dtype=np.float64, count=n)
+
+        # Sort by rounded top, then x0 (lexsort is stable, like sorted())
+        rounded = np.round(tops)
+        order = np.lexsort((x0s, rounded))
+        rounded = rounded[order]
+        x0s = x0s[order]
+        x1s = x1s[order]
+
+        # A line extends until the rounded top reaches its first char's top + 5;
+        # searchsorted finds each boundary in C, so Python loops per line, not per char
+        starts = []
+        start = 0
+        while start < n:
+            starts.append(start)
+            start = int(np.searchsorted(rounded, rounded[start] + 5, side='left'))
+        ends = starts[1:] + [n]
+
+        line_tops = np.minimum.reduceat(tops[order], starts).tolist()
+        line_bottoms = np.maximum.reduceat(bottoms[order], starts).tolist()
+        line_x0s = np.minimum.reduceat(x0s, starts).tolist()
+        line_x1s = np.maximum.reduceat(x1s, starts).tolist()
+        # Positions where x0 decreases; a line containing one needs an x0 sort
+        descents = (np.flatnonzero(x0s[1:] < x0s[:-1]) + 1).tolist()
+
+        texts = [chars[i].get('text', '') for i in order.tolist()]
+        inked = np.fromiter((bool(t.strip()) for t in texts), dtype=bool, count=n)
+        lines = []
+        for k, (s, e) in enumerate(zip(starts, ends)):
+            seg_x0s, seg_x1s, seg_inked = x0s[s:e], x1s[s:e], inked[s:e]
+            d = bisect.bisect_right(descents, s)
+            if d < len(descents) and descents[d] < e:
+                by_x0 = np.argsort(seg_x0s, kind='stable')
+                seg_x0s, seg_x1s, seg_inked = seg_x0s[by_x0], seg_x1s[by_x0], seg_inked[by_x0]
+            lines.append({
+                'text': ''.join(texts[s:e]),
+                'top': line_tops[k],
+                'bottom': line_bottoms[k],
+                'x0': line_x0s[k],
+                'x1': line_x1s[k],
+                'x0s': seg_x0s,
+                'x1s': seg_x1s,
+                'inked': seg_inked,
+            })
+
+        return lines
+
     def _make_line(self, chars) -> Dict:
-        """Create line dict from chars."""
+        """Create line dict from chars.
+
+        Besides the bounding box, a line keeps only what _find_word_gaps needs:
+        per-char x0/x1 and whether the char is inked, in x0 order.
+        """
         text = ''.join(c.get('text', '') for c in chars)
+        # Chars arrive sorted by (rounded top, x0), so they are already in x0
+        # order unless the line spans more than one rounded top
+        x0s = [c['x0'] for c in chars]
+        if any(a > b for a, b in zip(x0s, x0s[1:])):
+            chars = sorted(chars, key=itemgetter('x0'))
+            x0s = [c['x0'] for c in chars]
+        x1s = [c['x1'] for c in chars]
         return {
             'text': text,
             'top': min(c['top'] for c in chars),
             'bottom': max(c['bottom'] for c in chars),
-            'x0': min(c['x0'] for c in chars),
-            'x1': max(c['x1'] for c in chars),
-            'chars': chars,
+            'x0': x0s[0],
+            'x1': max(x1s),
+            'x0s': x0s,
+            'x1s': x1s,
+            'inked': [bool(c.get('text', '').strip()) for c in chars],
         }
 
-    def _check_runts(self, pages) -> None:
+    def _check_runts(self, page_num: int, lines: List[Dict]) -> None:
         """Detect runts (single word on last line of paragraph)."""
-        for page_num, page in enumerate(pages):
-            chars = page.chars
-            if not chars:
-                continue
+        if len(lines) < 2:
+            return
 
-            lines = self._group_chars_to_lines(chars)
-            if len(lines) < 2:
+        # Look for short last lines that might be runts; the first line has
+        # no previous line to compare against
+        for i in range(1, len(lines)):
+            line = lines[i]
+            text = line['text'].strip()
+
+            # Single short word: the length test rules out most lines before
+            # split() runs (split, not a space test, so tabs etc. still count)
+            if not text or len(text) >= 15 or len(text.split()) != 1:
                 continue
 
-            # Look for short last lines that might be runts
-            for i, line in enumerate(lines):
-                text = line['text'].strip()
-                words = text.split()
-
-                # Single word line
-                if len(words) == 1 and len(text) < 15:
-                    # Check if previous line is longer (paragraph continuation)
-                    if i > 0:
-                        prev_line = lines[i - 1]
-                        prev_line['text'].strip()
-
-                        # Previous line should be full-width for this to be a runt
-                        line_width = line['x1'] - line['x0']
-                        prev_width = prev_line['x1'] - prev_line['x0']
-
-                        if prev_width > line_width * 2:
-                            self.issues.append(Issue(
-                                type="runt",
-                                location=f"Page {page_num + 1}",
-                                severity=Severity.WARNING,
-                                description=f"Runt: '{text}' alone on line",
-                                details={"word": text, "page": page_num + 1},
-                                fix_suggestion="Rewrite to add words or tighten previous line"
-                            ))
-
-    def _check_rivers(self, pages) -> None:
+            # Previous line should be full-width for this to be a runt
+            prev_line = lines[i - 1]
+            line_width = line['x1'] - line['x0']
+            prev_width = prev_line['x1'] - prev_line['x0']
+
+            if prev_width > line_width * 2:
+                self.issues.append(Issue(
+                    type="runt",
+                    location=f"Page {page_num + 1}",
+                    severity=Severity.WARNING,
+                    description=f"Runt: '{text}' alone on line",
+                    details={"word": text, "page": page_num + 1},
+                    fix_suggestion="Rewrite to add words or tighten previous line"
+                ))
+
+    def _check_rivers(self, page_num: int, lines: List[Dict]) -> None:
         """Detect rivers (vertical white space gaps in justified text)."""
-        for page_num, page in enumerate(pages):
-            chars = page.chars
-            if not chars:
-                continue
+        if len(lines) < 3:
+            return
 
-            lines = self._group_chars_to_lines(chars)
-            if len(lines) < 3:
-                continue
+        # Gaps per line, computed once
+        gaps_per_line = [self._find_word_gaps(line) for line in lines]
+
+        for i, gap1 in self._aligned_gaps(gaps_per_line):
+            self.issues.append(Issue(
+                type="river",
+                location=f"Page {page_num + 1}, lines {i + 1}-{i + 3}",
+                severity=Severity.INFO,
+                description=f"Possible river at x={gap1:.0f}pt",
+                details={
+                    "x_position": gap1,
+                    "page": page_num + 1,
+                    "lines": [i + 1, i + 2, i + 3]
+                },
+                fix_suggestion="Adjust word spacing or rewrite text"
+            ))
+
+    def _aligned_gaps(self, gaps_per_line: List[List[float]]):
+        """Yield (line index, x) for each gap aligned with gaps on the next two lines."""
+        if njit is not None:
+            counts = [len(gaps) for gaps in gaps_per_line]
+            offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+            np.cumsum(counts, out=offsets[1:])
+            gaps = np.fromiter((g for line in gaps_per_line for g in line), dtype=np.float64, count=int(offsets[-1]))
+            # Each gap pair on lines i/i+1 yields at most one hit
+            capacity = sum(a * b for a, b in zip(counts, counts[1:]))
+            out_lines = np.empty(capacity, dtype=np.int64)
+            out_xs = np.empty(capacity, dtype=np.float64)
+            n = _river_core(gaps, offsets, _SortedGaps.TOLERANCE, out_lines, out_xs)
+            yield from zip(out_lines[:n].tolist(), out_xs[:n].tolist())
+            return
+
+        # Sorted copies of each line's gaps for bisection
+        sorted_gaps = [_SortedGaps(gaps) for gaps in gaps_per_line]
 
-            # Look for aligned word gaps across multiple lines
-            for i in range(len(lines) - 2):
-                gaps_line1 = self._find_word_gaps(lines[i])
-                gaps_line2 = self._find_word_gaps(lines[i + 1])
-                gaps_line3 = self._find_word_gaps(lines[i + 2])
-
-                # Check for vertically aligned gaps
-                for gap1 in gaps_line1:
-                    for gap2 in gaps_line2:
-                        if abs(gap1 - gap2) < 5:  # Aligned within 5pt
-                            for gap3 in gaps_line3:
-                                if abs(gap2 - gap3) < 5:
-                                    self.issues.append(Issue(
-                                        type="river",
-                                        location=f"Page {page_num + 1}, lines {i + 1}-{i + 3}",
-                                        severity=Severity.INFO,
-                                        description=f"Possible river at x={gap1:.0f}pt",
-                                        details={
-                                            "x_position": gap1,
-                                            "page": page_num + 1,
-                                            "lines": [i + 1, i + 2, i + 3]
-                                        },
-                                        fix_suggestion="Adjust word spacing or rewrite text"
-                                    ))
-                                    break
+        # Look for aligned word gaps across multiple lines
+        for i in range(len(gaps_per_line) - 2):
+            gaps_line2 = gaps_per_line[i + 1]
+            sorted_line2 = sorted_gaps[i + 1]
+            sorted_line3 = sorted_gaps[i + 2]
+
+            # Check for vertically aligned gaps (within 5pt)
+            for gap1 in gaps_per_line[i]:
+                for j in sorted_line2.near(gap1):
+                    if sorted_line3.any_near(gaps_line2[j]):
+                        yield i, gap1
 
     def _find_word_gaps(self, line: Dict) -> List[float]:
         """Find x-positions of word gaps in a line."""
-        chars = line.get('chars', [])
-        if not chars:
-            return []
+        x0s, x1s, inked = line['x0s'], line['x1s'], line['inked']
 
-        gaps = []
-        prev_char = None
+        if np is not None:
+            # Gap before each inked char (after the first) wider than a word space
+            starts, ends = x0s[1:], x1s[:-1]
+            mask = inked[1:] & (starts - ends > 3)
+            return ((ends[mask] + starts[mask]) * 0.5).tolist()
 
-        for char in sorted(chars, key=lambda c: c['x0']):
-            if prev_char and char.get('text', '').strip():
-                gap = char['x0'] - prev_char['x1']
+        gaps = []
+        for k in range(1, len(x0s)):
+            if inked[k]:
+                gap = x0s[k] - x1s[k - 1]
                 if gap > 3:  # Significant gap (word space)
-                    gaps.append((prev_char['x1'] + char['x0']) / 2)
-            prev_char = char
+                    gaps.append((x1s[k - 1] + x0s[k]) / 2)
 
         return gaps
 
     def _check_image_resolution(self) -> None:
         """Check image resolution for print (300 DPI minimum)."""
-        if not self.images_dir or not Image:
+        if not self.images_dir:
             return
 
+        candidates = list(_iter_images(str(self.images_dir)))
+
+        if self.use_cache:
+            # Images are keyed by what a stat() shows rather than by content,
+            # so a hit costs one stat per file instead of reading headers
+            h = hashlib.blake2b(digest_size=16)
+            for path in candidates:
+                st = os.stat(path)
+                h.update(f"{path}\0{st.st_size}\0{st.st_mtime_ns}\0".encode())
+            key = "images-" + h.hexdigest()
+            cached = _cache_load(key, len(candidates))
+            if cached is not None:
+                self.issues.extend(cached)
+                return
+
+        issues = []
+        # Reading image headers is mostly file I/O, which releases the GIL
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as pool:
+            for image_issues in pool.map(self._check_one_image, candidates):
+                issues.extend(image_issues)
+
+        if self.use_cache:
+            _cache_store(key, len(candidates), issues)
+        self.issues.extend(issues)
+
+    def _check_one_image(self, img_path: str) -> List[Issue]:
+        """Check one image's resolution and color mode from its header."""
         min_dpi = 300
-        image_extensions = {'.jpg', '.jpeg', '.png', '.tiff', '.tif'}
-
-        for img_path in self.images_dir.rglob('*'):
-            if img_path.suffix.lower() not in image_extensions:
-                continue
-
-            try:
+        name = os.path.basename(img_path)
+        issues = []
+
+        try:
+            header = _read_image_header(img_path)
+            if header is None:
+                # TIFF and anything unusual goes through Pillow
+                if not Image:
+                    return issues
                 with Image.open(img_path) as img:
-                    dpi = img.info.get('dpi', (72, 72))
-                    if isinstance(dpi, tuple):
-                        dpi_x, dpi_y = dpi
-                    else:
-                        dpi_x = dpi_y = dpi
-
-                    if dpi_x < min_dpi or dpi_y < min_dpi:
-                        self.issues.append(Issue(
-                            type="low_resolution",
-                            location=str(img_path.name),
-                            severity=Severity.ERROR,
-                            description=f"Image resolution {dpi_x}x{dpi_y} DPI below {min_dpi} DPI",
-                            details={
-                                "file": str(img_path),
-                                "dpi": (dpi_x, dpi_y),
-                                "dimensions": img.size,
-                            },
-                            fix_suggestion=f"Replace with {min_dpi}+ DPI image or reduce print size"
-                        ))
-
-                    # Check color mode
-                    if img.mode == 'RGB':
-                        self.issues.append(Issue(
-                            type="rgb_image",
-                            location=str(img_path.name),
-                            severity=Severity.WARNING,
-                            description="Image is RGB, should be CMYK for print",
-                            details={
-                                "file": str(img_path),
-                                "mode": img.mode,
-                            },
-                            fix_suggestion="Convert to CMYK color profile"
-                        ))
-
-            except Exception as e:
-                self.issues.append(Issue(
-                    type="image_error",
-                    location=str(img_path.name),
+                    header = img.info, img.mode, img.size
+            info, mode, size = header
+            dpi = info.get('dpi', (72, 72))
+            if isinstance(dpi, tuple):
+                dpi_x, dpi_y = dpi
+            else:
+                dpi_x = dpi_y = dpi
+
+            if dpi_x < min_dpi or dpi_y < min_dpi:
+                issues.append(Issue(
+                    type="low_resolution",
+                    location=name,
                     severity=Severity.ERROR,
-                    description=f"Could not read image: {e}",
-                    details={"file": str(img_path), "error": str(e)},
+                    description=f"Image resolution {dpi_x}x{dpi_y} DPI below {min_dpi} DPI",
+                    # Pillow's TIFF dpi values are IFDRationals, which the
+                    # cache and JSON reports can't serialize
+                    details={
+                        "file": img_path,
+                        "dpi": [float(dpi_x), float(dpi_y)],
+                        "dimensions": list(size),
+                    },
+                    fix_suggestion=f"Replace with {min_dpi}+ DPI image or reduce print size"
                 ))
 
+            # Check color mode
+            if mode == 'RGB':
+                issues.append(Issue(
+                    type="rgb_image",
+                    location=name,
+                    severity=Severity.WARNING,
+                    description="Image is RGB, should be CMYK for print",
+                    details={
+                        "file": img_path,
+                        "mode": mode,
+                    },
+                    fix_suggestion="Convert to CMYK color profile"
+                ))
+
+        except Exception as e:
+            issues.append(Issue(
+                type="image_error",
+                location=name,
+                severity=Severity.ERROR,
+                description=f"Could not read image: {e}",
+                details={"file": img_path, "error": str(e)},
+            ))
+
+        return issues
+
     def generate_report(self, format: str = "console") -> str:
         """Generate preflight report."""
         if format == "json":
@@ -269,45 +760,41 @@ class PreflightChecker:
         """Console report."""
         if not self.issues:
             return "Preflight: No issues found."
+        return "\n".join(self._console_lines())
 
-        lines = [
-            f"\nPreflight Report: {self.pdf_path.name}",
-            "=" * 60,
-            ""
-        ]
-
-        errors = [i for i in self.issues if i.severity == Severity.ERROR]
-        warnings = [i for i in self.issues if i.severity == Severity.WARNING]
-        infos = [i for i in self.issues if i.severity == Severity.INFO]
+    def _console_lines(self):
+        """Yield the console report line by line."""
+        yield f"\nPreflight Report: {self.pdf_path.name}"
+        yield "=" * 60
+        yield ""
 
-        lines.append(f"Found {len(errors)} error(s), {len(warnings)} warning(s), {len(infos)} info(s)\n")
+        counts = Counter(i.severity for i in self.issues)
+        yield (f"Found {counts[Severity.ERROR]} error(s), {counts[Severity.WARNING]} warning(s), "
+               f"{counts[Severity.INFO]} info(s)\n")
 
         for issue in self.issues:
-            icon = {"error": "!!", "warning": "--", "info": "  "}[issue.severity.value]
-            lines.append(f"[{icon}] {issue.location}: {issue.type}")
-            lines.append(f"    {issue.description}")
+            yield f"[{_SEVERITY_ICONS[issue.severity]}] {issue.location}: {issue.type}"
+            yield f"    {issue.description}"
             if issue.fix_suggestion:
-                lines.append(f"    Fix: {issue.fix_suggestion}")
-            lines.append("")
-
-        return "\n".join(lines)
+                yield f"    Fix: {issue.fix_suggestion}"
+            yield ""
 
     def _report_json(self) -> str:
         """JSON report."""
-        return json.dumps({
+        payload = {
             "pdf": str(self.pdf_path),
-            "issues": [
-                {
-                    "type": i.type,
-                    "location": i.location,
-                    "severity": i.severity.value,
-                    "description": i.description,
-                    "details": i.details,
-                    "fix_suggestion": i.fix_suggestion,
-                }
-                for i in self.issues
-            ]
-        }, indent=2)
+            "issues": [_issue_to_dict(i) for i in self.issues],
+        }
+        if orjson is not None:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(payload, indent=2)
+
+
+def _check_page_range(pdf_path: str, start: int, stop: int) -> List[Issue]:
+    """Worker entry point: check pages [start, stop) in a subprocess."""
+    checker = PreflightChecker(pdf_path, workers=1, use_cache=False)
+    checker._check_range(start, stop)
+    return checker.issues
 
 
 def main():
@@ -315,13 +802,16 @@ def main():
     parser.add_argument("pdf", help="Path to PDF file")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--images-dir", help="Directory containing source images to check")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count, at most 8)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and don't update the result cache")
     args = parser.parse_args()
 
     if not Path(args.pdf).exists():
         print(f"Error: PDF not found: {args.pdf}", file=sys.stderr)
         sys.exit(1)
 
-    checker = PreflightChecker(args.pdf, args.images_dir)
+    checker = PreflightChecker(args.pdf, args.images_dir, workers=args.workers,
+                               use_cache=not args.no_cache)
     checker.check_all()
 
     if args.json:
@@ -12,7 +12,9 @@ The system is based on:
 - Density axis (tight → normal → loose)
 """
 
+import bisect
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import Dict, Optional
 from pathlib import Path
 
@@ -28,6 +30,43 @@ TYPE_SCALE = [0.75, 0.875, 1, 1.125, 1.25, 1.5, 1.75, 2, 2.5, 3]
 # Spacing scale multipliers (for margins, padding, gaps)
 SPACE_SCALE = [0.25, 0.5, 0.75, 1, 1.5, 2, 3, 4, 6, 8]
 
+# Scale step names, shared by every TypographySystem
+_SIZE_KEYS = tuple(f"size-{i + 1}" for i in range(len(TYPE_SCALE)))
+_SPACE_KEYS = tuple(f"space-{i + 1}" for i in range(len(SPACE_SCALE)))
+
+# Semantic names for scale steps: (alias, step)
+_TYPE_ALIASES = (
+    ("small", "size-1"),  # 0.75x
+    ("caption", "size-2"),  # 0.875x
+    ("body", "size-3"),  # 1x
+    ("lead", "size-4"),  # 1.125x
+    ("h6", "size-5"),  # 1.25x
+    ("h5", "size-6"),  # 1.5x
+    ("h4", "size-7"),  # 1.75x
+    ("h3", "size-8"),  # 2x
+    ("h2", "size-9"),  # 2.5x
+    ("h1", "size-10"),  # 3x
+)
+_SPACE_ALIASES = (
+    ("xs", "space-1"),
+    ("sm", "space-2"),
+    ("md", "space-4"),  # = baseline
+    ("lg", "space-6"),
+    ("xl", "space-8"),
+    ("2xl", "space-10"),
+)
+
+# Margin-top of each heading level, in baselines: (level, baselines)
+# Larger headings get more space above
+_HEADING_MARGIN_TOP_BASELINES = (
+    ("h1", 4),  # Chapter headings: lots of space
+    ("h2", 3),
+    ("h3", 2),
+    ("h4", 2),
+    ("h5", 1),
+    ("h6", 1),
+)
+
 # Density presets
 DENSITY_PRESETS = {
     "tight": {
@@ -78,6 +117,23 @@ DENSITY_PRESETS = {
 }
 
 
+# Numeric density settings, interpolated for custom (0.0-1.0) densities
+_DENSITY_NUMERIC_KEYS = ("line_height_body", "line_height_heading", "para_spacing_factor",
+                         "margin_factor", "base_size_pt")
+# The gradient from tight (0.0) to loose (1.0), one row of settings per preset
+_DENSITY_POSITIONS = (0.0, 0.25, 0.5, 0.75, 1.0)
+_DENSITY_ROWS = tuple(
+    tuple(DENSITY_PRESETS[preset][key] for key in _DENSITY_NUMERIC_KEYS)
+    for preset in ("tight", "snug", "normal", "relaxed", "loose")
+)
+# The same settings as one column per key, for side-by-side preset comparisons
+_DENSITY_COLUMNS = dict(zip(_DENSITY_NUMERIC_KEYS, zip(*_DENSITY_ROWS)))
+
+
+# Bundled font files
+_FONTS_DIR = Path(__file__).parent / "fonts"
+
+
 # =============================================================================
 # Font Pairs
 # =============================================================================
@@ -86,7 +142,7 @@ DENSITY_PRESETS = {
 # Fonts with smaller x-height will be scaled up to appear equivalent
 REFERENCE_X_HEIGHT = 0.50
 
-@dataclass
+@dataclass(frozen=True)
 class FontPair:
     """A curated font pairing for books."""
     name: str
@@ -99,6 +155,12 @@ class FontPair:
     # These are used for optical size normalization
     display_x_height: float = 0.50  # Default/fallback
     body_x_height: float = 0.50  # Default/fallback
+    # Adjustment against REFERENCE_X_HEIGHT, precomputed in __post_init__
+    _optical_adj: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        adj = REFERENCE_X_HEIGHT / self.body_x_height if self.body_x_height > 0 else 1.0
+        object.__setattr__(self, '_optical_adj', adj)
 
     def optical_adjustment(self, reference: float = REFERENCE_X_HEIGHT) -> float:
         """
@@ -107,6 +169,8 @@ class FontPair:
         Returns multiplier to apply to base size so fonts with different
         x-heights appear optically equivalent.
         """
+        if reference == REFERENCE_X_HEIGHT:
+            return self._optical_adj
         if self.body_x_height <= 0:
             return 1.0
         return reference / self.body_x_height
@@ -139,100 +203,159 @@ FONT_X_HEIGHTS = {
 }
 
 
-def _get_x_height(font_name: str) -> float:
-    """Get x-height ratio for a font, with fallback."""
-    return FONT_X_HEIGHTS.get(font_name, 0.50)
-
-
-FONT_PAIRS: Dict[str, FontPair] = {
+# (key, name, display font, body font, style[, fallback display, fallback body])
+_FONT_PAIR_SPECS = [
     # Serif pairs (classic book typography)
-    "playfair-lora": FontPair(
-        "Playfair + Lora",
-        "Playfair Display", "Lora",
-        "Elegant literary fiction",
-        display_x_height=_get_x_height("Playfair Display"),
-        body_x_height=_get_x_height("Lora"),
-    ),
-    "libre-crimson": FontPair(
-        "Libre Baskerville + Crimson",
-        "Libre Baskerville", "Crimson Text",
-        "Classic traditional",
-        display_x_height=_get_x_height("Libre Baskerville"),
-        body_x_height=_get_x_height("Crimson Text"),
-    ),
-    "merriweather-merriweather": FontPair(
-        "Merriweather",
-        "Merriweather", "Merriweather",
-        "Warm readable serif",
-        display_x_height=_get_x_height("Merriweather"),
-        body_x_height=_get_x_height("Merriweather"),
-    ),
-    "source-serif": FontPair(
-        "Source Serif Pro",
-        "Source Serif Pro", "Source Serif Pro",
-        "Clean modern serif",
-        display_x_height=_get_x_height("Source Serif Pro"),
-        body_x_height=_get_x_height("Source Serif Pro"),
-    ),
-    "spectral-spectral": FontPair(
-        "Spectral",
-        "Spectral", "Spectral",
-        "Refined book typography",
-        display_x_height=_get_x_height("Spectral"),
-        body_x_height=_get_x_height("Spectral"),
-    ),
+    ("playfair-lora", "Playfair + Lora", "Playfair Display", "Lora", "Elegant literary fiction"),
+    ("libre-crimson", "Libre Baskerville + Crimson", "Libre Baskerville", "Crimson Text", "Classic traditional"),
+    ("merriweather-merriweather", "Merriweather", "Merriweather", "Merriweather", "Warm readable serif"),
+    ("source-serif", "Source Serif Pro", "Source Serif Pro", "Source Serif Pro", "Clean modern serif"),
+    ("spectral-spectral", "Spectral", "Spectral", "Spectral", "Refined book typography"),
 
     # Mixed pairs (serif headings, sans body or vice versa)
-    "playfair-lato": FontPair(
-        "Playfair + Lato",
-        "Playfair Display", "Lato",
-        "Elegant with modern readability",
-        display_x_height=_get_x_height("Playfair Display"),
-        body_x_height=_get_x_height("Lato"),
-    ),
-    "merriweather-opensans": FontPair(
-        "Merriweather + Open Sans",
-        "Merriweather", "Open Sans",
-        "Warm headers, clean body",
-        display_x_height=_get_x_height("Merriweather"),
-        body_x_height=_get_x_height("Open Sans"),
-    ),
-    "poppins-lora": FontPair(
-        "Poppins + Lora",
-        "Poppins", "Lora",
-        "Modern headers, classic body",
-        display_x_height=_get_x_height("Poppins"),
-        body_x_height=_get_x_height("Lora"),
-    ),
+    ("playfair-lato", "Playfair + Lato", "Playfair Display", "Lato", "Elegant with modern readability"),
+    ("merriweather-opensans", "Merriweather + Open Sans", "Merriweather", "Open Sans", "Warm headers, clean body"),
+    ("poppins-lora", "Poppins + Lora", "Poppins", "Lora", "Modern headers, classic body"),
 
     # Sans pairs (modern non-fiction)
-    "inter-inter": FontPair(
-        "Inter",
-        "Inter", "Inter",
-        "Clean technical documentation",
-        "Arial", "Arial",
-        display_x_height=_get_x_height("Inter"),
-        body_x_height=_get_x_height("Inter"),
-    ),
-    "work-sans-source": FontPair(
-        "Work Sans + Source Serif",
-        "Work Sans", "Source Serif Pro",
-        "Professional business books",
-        display_x_height=_get_x_height("Work Sans"),
-        body_x_height=_get_x_height("Source Serif Pro"),
-    ),
+    ("inter-inter", "Inter", "Inter", "Inter", "Clean technical documentation", "Arial", "Arial"),
+    ("work-sans-source", "Work Sans + Source Serif", "Work Sans", "Source Serif Pro", "Professional business books"),
 
     # Your current default
-    "baloo-montserrat": FontPair(
-        "Baloo Bhai 2 + Montserrat",
-        "Baloo Bhai 2", "Montserrat",
-        "Distinctive warm display",
-        display_x_height=_get_x_height("Baloo Bhai 2"),
-        body_x_height=_get_x_height("Montserrat"),
-    ),
+    ("baloo-montserrat", "Baloo Bhai 2 + Montserrat", "Baloo Bhai 2", "Montserrat", "Distinctive warm display"),
+]
+
+FONT_PAIRS: Dict[str, FontPair] = {
+    key: FontPair(
+        name, display, body, style, *fallbacks,
+        display_x_height=FONT_X_HEIGHTS.get(display, 0.50),
+        body_x_height=FONT_X_HEIGHTS.get(body, 0.50),
+    )
+    for key, name, display, body, style, *fallbacks in _FONT_PAIR_SPECS
 }
 
 
+# =============================================================================
+# CSS
+# =============================================================================
+
+# Per-level heading rules; they only reference variables, so they're static
+_CSS_HEADING_RULES = "\n".join(
+    f"{level} {{\n"
+    f"    font-size: var(--{level});\n"
+    f"    margin-top: var(--{level}-margin-top);\n"
+    f"    margin-bottom: var(--{level}-margin-bottom);\n"
+    "}\n"
+    for level in ("h1", "h2", "h3", "h4", "h5", "h6")
+)
+
+# Stylesheet emitted by TypographySystem.css_variables (str.format fields;
+# literal CSS braces are doubled)
+_CSS_TEMPLATE = """\
+/* BookCrafter Typography System */
+/* Font pair: {fonts.name} */
+/* Density: {density_name} */
+/* Baseline grid: {baseline_unit}pt */
+
+:root {{
+    /* Fonts */
+    --font-display: "{fonts.display}", {fonts.fallback_display}, serif;
+    --font-body: "{fonts.body}", {fonts.fallback_body}, serif;
+
+    /* Baseline Grid */
+    --baseline-unit: {baseline_unit}pt;
+    --body-size: {body_size}pt;
+
+    /* Type Scale */
+{type_scale}
+
+    /* Heading Grid Margins (snapped to baseline) */
+{heading_margins}
+
+    /* Spacing Scale (baseline multiples) */
+{space_scale}
+
+    /* Line Heights */
+{line_heights}
+}}
+
+/* ==========================================================================
+   Baseline Grid Typography
+   All vertical spacing aligns to the baseline grid.
+   ========================================================================== */
+
+body {{
+    font-family: var(--font-body);
+    font-size: var(--body-size);
+    line-height: var(--line-height-body);
+}}
+
+/* Paragraphs: 1 baseline between */
+p {{
+    margin-top: 0;
+    margin-bottom: var(--baseline-unit);
+}}
+
+/* Remove margin from last paragraph in container */
+p:last-child {{
+    margin-bottom: 0;
+}}
+
+/* Headings: calculated margins to snap following text to grid */
+h1, h2, h3, h4, h5, h6 {{
+    font-family: var(--font-display);
+    line-height: var(--line-height-heading);
+}}
+
+{heading_rules}
+/* First heading on page/section: no top margin */
+.chapter > h1:first-child,
+section > h1:first-child,
+article > h1:first-child,
+.frontmatter h1:first-child {{
+    margin-top: 0;
+}}
+
+/* Lists: align to baseline */
+ul, ol {{
+    margin-top: 0;
+    margin-bottom: var(--baseline-unit);
+    padding-left: calc(var(--baseline-unit) * 1.5);
+}}
+
+li {{
+    margin-bottom: calc(var(--baseline-unit) * 0.5);
+}}
+
+li:last-child {{
+    margin-bottom: 0;
+}}
+
+/* Blockquotes: indented, baseline-aligned */
+blockquote {{
+    margin-top: var(--baseline-unit);
+    margin-bottom: var(--baseline-unit);
+    margin-left: var(--baseline-unit);
+    padding-left: var(--baseline-unit);
+    border-left: 2pt solid currentColor;
+}}
+
+/* Lead paragraph */
+.lead {{
+    font-size: var(--lead);
+}}
+
+/* Small text */
+.small, small, figcaption {{
+    font-size: var(--small);
+}}
+
+.caption {{
+    font-size: var(--caption);
+    color: var(--color-muted, #666);
+}}"""
+
+
 # =============================================================================
 # Typography System
 # =============================================================================
@@ -289,63 +412,33 @@ class TypographySystem:
         # Clamp to 0-1
         value = max(0.0, min(1.0, value))
 
-        # Define the gradient
-        presets = ["tight", "snug", "normal", "relaxed", "loose"]
-        positions = [0.0, 0.25, 0.5, 0.75, 1.0]
-
         # Find which two presets to interpolate between
-        for i in range(len(positions) - 1):
-            if positions[i] <= value <= positions[i + 1]:
-                t = (value - positions[i]) / (positions[i + 1] - positions[i])
-                p1 = DENSITY_PRESETS[presets[i]]
-                p2 = DENSITY_PRESETS[presets[i + 1]]
-
-                return {
-                    "name": f"Custom ({value:.2f})",
-                    "description": "Interpolated density",
-                    "line_height_body": p1["line_height_body"] + t * (p2["line_height_body"] - p1["line_height_body"]),
-                    "line_height_heading": p1["line_height_heading"] + t * (p2["line_height_heading"] - p1["line_height_heading"]),
-                    "para_spacing_factor": p1["para_spacing_factor"] + t * (p2["para_spacing_factor"] - p1["para_spacing_factor"]),
-                    "margin_factor": p1["margin_factor"] + t * (p2["margin_factor"] - p1["margin_factor"]),
-                    "base_size_pt": p1["base_size_pt"] + t * (p2["base_size_pt"] - p1["base_size_pt"]),
-                }
-
-        return DENSITY_PRESETS["normal"]
+        i = max(bisect.bisect_left(_DENSITY_POSITIONS, value) - 1, 0)
+        lo, hi = _DENSITY_POSITIONS[i], _DENSITY_POSITIONS[i + 1]
+        t = (value - lo) / (hi - lo)
+        row1, row2 = _DENSITY_ROWS[i], _DENSITY_ROWS[i + 1]
+
+        config = {
+            "name": f"Custom ({value:.2f})",
+            "description": "Interpolated density",
+        }
+        config.update(zip(_DENSITY_NUMERIC_KEYS, [a + t * (b - a) for a, b in zip(row1, row2)]))
+        return config
 
     def _generate_scales(self):
         """Generate the type and spacing scales."""
-        # Type scale (font sizes)
-        self.type_scale_pt = {}
-        for i, multiplier in enumerate(TYPE_SCALE):
-            size = round(self.baseline_pt * multiplier, 2)
-            self.type_scale_pt[f"size-{i+1}"] = size
-
-        # Also add semantic names
-        self.type_scale_pt["small"] = self.type_scale_pt["size-1"]  # 0.75x
-        self.type_scale_pt["caption"] = self.type_scale_pt["size-2"]  # 0.875x
-        self.type_scale_pt["body"] = self.type_scale_pt["size-3"]  # 1x
-        self.type_scale_pt["lead"] = self.type_scale_pt["size-4"]  # 1.125x
-        self.type_scale_pt["h6"] = self.type_scale_pt["size-5"]  # 1.25x
-        self.type_scale_pt["h5"] = self.type_scale_pt["size-6"]  # 1.5x
-        self.type_scale_pt["h4"] = self.type_scale_pt["size-7"]  # 1.75x
-        self.type_scale_pt["h3"] = self.type_scale_pt["size-8"]  # 2x
-        self.type_scale_pt["h2"] = self.type_scale_pt["size-9"]  # 2.5x
-        self.type_scale_pt["h1"] = self.type_scale_pt["size-10"]  # 3x
-
-        # Spacing scale
+        baseline = self.baseline_pt
+
+        # Type scale (font sizes), plus semantic names
+        type_scale = dict(zip(_SIZE_KEYS, [round(baseline * m, 2) for m in TYPE_SCALE]))
+        type_scale.update([(alias, type_scale[step]) for alias, step in _TYPE_ALIASES])
+        self.type_scale_pt = type_scale
+
+        # Spacing scale, plus semantic names
         para_factor = self.density_config["para_spacing_factor"]
-        self.space_scale_pt = {}
-        for i, multiplier in enumerate(SPACE_SCALE):
-            space = round(self.baseline_pt * multiplier * para_factor, 2)
-            self.space_scale_pt[f"space-{i+1}"] = space
-
-        # Semantic spacing names
-        self.space_scale_pt["xs"] = self.space_scale_pt["space-1"]
-        self.space_scale_pt["sm"] = self.space_scale_pt["space-2"]
-        self.space_scale_pt["md"] = self.space_scale_pt["space-4"]  # = baseline
-        self.space_scale_pt["lg"] = self.space_scale_pt["space-6"]
-        self.space_scale_pt["xl"] = self.space_scale_pt["space-8"]
-        self.space_scale_pt["2xl"] = self.space_scale_pt["space-10"]
+        space_scale = dict(zip(_SPACE_KEYS, [round(baseline * m * para_factor, 2) for m in SPACE_SCALE]))
+        space_scale.update([(alias, space_scale[step]) for alias, step in _SPACE_ALIASES])
+        self.space_scale_pt = space_scale
 
         # Line heights
         self.line_heights = {
@@ -374,42 +467,32 @@ class TypographySystem:
         # Each heading needs: margin-top (visual space) + margin-bottom (snap to grid)
         heading_lh = self.line_heights["heading"]
 
-        self.heading_grid = {}
+        unit = self.baseline_unit_pt
+        heading_grid = {}
 
-        for level in ["h1", "h2", "h3", "h4", "h5", "h6"]:
+        for level, margin_top_baselines in _HEADING_MARGIN_TOP_BASELINES:
             size = self.type_scale_pt[level]
 
             # Natural height of heading (size × heading line-height)
             natural_height = size * heading_lh
 
             # How many baseline units does this span? Round up.
-            baseline_spans = natural_height / self.baseline_unit_pt
+            baseline_spans = natural_height / unit
             snapped_spans = int(baseline_spans) + (1 if baseline_spans % 1 > 0.01 else 0)
 
             # Total height needed to snap to grid
-            snapped_height = snapped_spans * self.baseline_unit_pt
+            snapped_height = snapped_spans * unit
 
             # Padding needed to reach grid
             snap_padding = snapped_height - natural_height
 
-            # Determine margin-top (visual separation) based on heading level
-            # Larger headings get more space above
-            margin_top_baselines = {
-                "h1": 4,  # Chapter headings: lots of space
-                "h2": 3,
-                "h3": 2,
-                "h4": 2,
-                "h5": 1,
-                "h6": 1,
-            }
-
-            margin_top = margin_top_baselines[level] * self.baseline_unit_pt
+            margin_top = margin_top_baselines * unit
 
             # margin-bottom = snap_padding (to land next text on grid)
             # If snap_padding is tiny, add a full baseline for readability
-            margin_bottom = snap_padding if snap_padding >= self.baseline_unit_pt * 0.25 else snap_padding + self.baseline_unit_pt
+            margin_bottom = snap_padding if snap_padding >= unit * 0.25 else snap_padding + unit
 
-            self.heading_grid[level] = {
+            heading_grid[level] = {
                 "size_pt": size,
                 "natural_height_pt": round(natural_height, 3),
                 "baseline_spans": snapped_spans,
@@ -419,157 +502,41 @@ class TypographySystem:
                 "total_height_pt": round(margin_top + snapped_height + margin_bottom, 3),
             }
 
+        self.heading_grid = heading_grid
+
         # Paragraph spacing (1 baseline between paragraphs)
         self.para_margin_pt = self.baseline_unit_pt
 
     def to_css_variables(self) -> str:
         """Generate CSS custom properties with baseline grid."""
-        lines = [
-            "/* BookCrafter Typography System */",
-            f"/* Font pair: {self.fonts.name} */",
-            f"/* Density: {self.density_config['name']} */",
-            f"/* Baseline grid: {self.baseline_unit_pt}pt */",
-            "",
-            ":root {",
-            "    /* Fonts */",
-            f'    --font-display: "{self.fonts.display}", {self.fonts.fallback_display}, serif;',
-            f'    --font-body: "{self.fonts.body}", {self.fonts.fallback_body}, serif;',
-            "",
-            "    /* Baseline Grid */",
-            f"    --baseline-unit: {self.baseline_unit_pt}pt;",
-            f"    --body-size: {self.type_scale_pt['body']}pt;",
-            "",
-            "    /* Type Scale */",
-        ]
-
-        for name, size in self.type_scale_pt.items():
-            lines.append(f"    --{name}: {size}pt;")
-
-        lines.extend([
-            "",
-            "    /* Heading Grid Margins (snapped to baseline) */",
-        ])
-
-        for level in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-            grid = self.heading_grid[level]
-            lines.append(f"    --{level}-margin-top: {grid['margin_top_pt']}pt;")
-            lines.append(f"    --{level}-margin-bottom: {grid['margin_bottom_pt']}pt;")
-
-        lines.extend([
-            "",
-            "    /* Spacing Scale (baseline multiples) */",
-        ])
-
-        for name, space in self.space_scale_pt.items():
-            lines.append(f"    --{name}: {space}pt;")
-
-        lines.extend([
-            "",
-            "    /* Line Heights */",
-        ])
-
-        for name, lh in self.line_heights.items():
-            lines.append(f"    --line-height-{name}: {lh};")
-
-        lines.extend([
-            "}",
-            "",
-            "/* ==========================================================================",
-            "   Baseline Grid Typography",
-            "   All vertical spacing aligns to the baseline grid.",
-            "   ========================================================================== */",
-            "",
-            "body {",
-            "    font-family: var(--font-body);",
-            "    font-size: var(--body-size);",
-            "    line-height: var(--line-height-body);",
-            "}",
-            "",
-            "/* Paragraphs: 1 baseline between */",
-            "p {",
-            "    margin-top: 0;",
-            "    margin-bottom: var(--baseline-unit);",
-            "}",
-            "",
-            "/* Remove margin from last paragraph in container */",
-            "p:last-child {",
-            "    margin-bottom: 0;",
-            "}",
-            "",
-            "/* Headings: calculated margins to snap following text to grid */",
-            "h1, h2, h3, h4, h5, h6 {",
-            "    font-family: var(--font-display);",
-            "    line-height: var(--line-height-heading);",
-            "}",
-            "",
-        ])
-
-        # Generate individual heading rules with calculated margins
-        for level in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-            grid = self.heading_grid[level]
-            lines.extend([
-                f"{level} {{",
-                f"    font-size: var(--{level});",
-                f"    margin-top: var(--{level}-margin-top);",
-                f"    margin-bottom: var(--{level}-margin-bottom);",
-                "}",
-                "",
-            ])
-
-        # First heading on page (no top margin)
-        lines.extend([
-            "/* First heading on page/section: no top margin */",
-            ".chapter > h1:first-child,",
-            "section > h1:first-child,",
-            "article > h1:first-child,",
-            ".frontmatter h1:first-child {",
-            "    margin-top: 0;",
-            "}",
-            "",
-            "/* Lists: align to baseline */",
-            "ul, ol {",
-            "    margin-top: 0;",
-            "    margin-bottom: var(--baseline-unit);",
-            "    padding-left: calc(var(--baseline-unit) * 1.5);",
-            "}",
-            "",
-            "li {",
-            "    margin-bottom: calc(var(--baseline-unit) * 0.5);",
-            "}",
-            "",
-            "li:last-child {",
-            "    margin-bottom: 0;",
-            "}",
-            "",
-            "/* Blockquotes: indented, baseline-aligned */",
-            "blockquote {",
-            "    margin-top: var(--baseline-unit);",
-            "    margin-bottom: var(--baseline-unit);",
-            "    margin-left: var(--baseline-unit);",
-            "    padding-left: var(--baseline-unit);",
-            "    border-left: 2pt solid currentColor;",
-            "}",
-            "",
-            "/* Lead paragraph */",
-            ".lead {",
-            "    font-size: var(--lead);",
-            "}",
-            "",
-            "/* Small text */",
-            ".small, small, figcaption {",
-            "    font-size: var(--small);",
-            "}",
-            "",
-            ".caption {",
-            "    font-size: var(--caption);",
-            "    color: var(--color-muted, #666);",
-            "}",
-        ])
-
-        return "\n".join(lines)
+        return self.css_variables
+
+    @cached_property
+    def css_variables(self) -> str:
+        """CSS custom properties with baseline grid, built once per system."""
+        return _CSS_TEMPLATE.format(
+            fonts=self.fonts,
+            density_name=self.density_config['name'],
+            baseline_unit=self.baseline_unit_pt,
+            body_size=self.type_scale_pt['body'],
+            type_scale="\n".join([f"    --{name}: {size}pt;" for name, size in self.type_scale_pt.items()]),
+            heading_margins="\n".join([
+                f"    --{level}-margin-top: {grid['margin_top_pt']}pt;\n"
+                f"    --{level}-margin-bottom: {grid['margin_bottom_pt']}pt;"
+                for level, grid in self.heading_grid.items()
+            ]),
+            space_scale="\n".join([f"    --{name}: {space}pt;" for name, space in self.space_scale_pt.items()]),
+            line_heights="\n".join([f"    --line-height-{name}: {lh};" for name, lh in self.line_heights.items()]),
+            heading_rules=_CSS_HEADING_RULES,
+        )
 
     def to_css_debug_grid(self) -> str:
         """Generate CSS for debug baseline grid overlay."""
+        return self.css_debug_grid
+
+    @cached_property
+    def css_debug_grid(self) -> str:
+        """CSS for the debug baseline grid overlay, built once per system."""
         return f"""
 /* Debug: Baseline Grid Overlay
    Add class="show-grid" to body to display */
@@ -684,6 +651,19 @@ Line Heights:
         }
 
 
+@lru_cache(maxsize=128, typed=True)
+def get_typography_system(font_pair: str = "merriweather-merriweather", density="normal",
+                          base_size_pt: Optional[float] = None,
+                          normalize_optical: bool = True) -> TypographySystem:
+    """
+    Return a TypographySystem, shared between calls with the same inputs.
+
+    The system is fully computed in __post_init__ and not modified afterwards,
+    so callers must treat the returned instance as read-only.
+    """
+    return TypographySystem(font_pair, density, base_size_pt, normalize_optical)
+
+
 # =============================================================================
 # Convenience functions
 # =============================================================================
@@ -722,29 +702,55 @@ def update_x_heights_from_fonts(fonts_dir: Path = None):
     This reads TTF files and extracts real x-height ratios.
     """
     try:
-        from font_metrics import extract_all_fonts
+        x_heights = _load_x_heights(fonts_dir or _FONTS_DIR)
     except ImportError:
         print("font_metrics module not available")
         return
 
-    if fonts_dir is None:
-        fonts_dir = Path(__file__).parent / "fonts"
-
-    print(f"Extracting x-heights from {fonts_dir}...")
-    metrics = extract_all_fonts(fonts_dir)
-
-    if not metrics:
+    if not x_heights:
         print("No fonts found. Run: python font_downloader.py download-all")
         return
 
     print("\nExtracted x-height ratios:")
     print("-" * 50)
-    for key, m in sorted(metrics.items()):
-        print(f'    "{m.family_name}": {m.x_height_ratio:.3f},')
+    for family, ratio in x_heights:
+        print(f'    "{family}": {ratio:.3f},')
 
     print("\nCopy these values to FONT_X_HEIGHTS in typography.py")
 
 
+@lru_cache(maxsize=None)
+def _load_x_heights(fonts_dir: Path):
+    """
+    (family, x-height ratio) pairs for the TTFs in fonts_dir, sorted by key.
+
+    Parsing TTFs is slow, so font_metrics' JSON sidecar is reused when it is
+    newer than every font file and has a family for each of them, and the
+    result is memoized per directory.
+    """
+    # fontTools is only needed here, so font_metrics is imported lazily
+    from font_metrics import CACHE_FILE, extract_all_fonts, load_metrics_cache
+
+    # The directory's own mtime changes when fonts are added or removed
+    ttf_files = list(fonts_dir.glob("*.ttf"))
+    mtimes = [f.stat().st_mtime for f in ttf_files]
+    metrics = None
+    if fonts_dir == _FONTS_DIR and mtimes and CACHE_FILE.exists():
+        if CACHE_FILE.stat().st_mtime >= max(mtimes + [fonts_dir.stat().st_mtime]):
+            metrics = load_metrics_cache()
+            # get_font_metrics() rewrites the sidecar as it caches single
+            # fonts, so it may hold only some families. Files are named
+            # "<Family>-<Weight>.ttf", so every family prefix must appear.
+            families = {Path(m.file_path).stem.split("-", 1)[0] for m in metrics.values()}
+            if any(f.stem.split("-", 1)[0] not in families for f in ttf_files):
+                metrics = None
+    if not metrics:
+        print(f"Extracting x-heights from {fonts_dir}...")
+        metrics = extract_all_fonts(fonts_dir)
+
+    return tuple((m.family_name, m.x_height_ratio) for _, m in sorted(metrics.items()))
+
+
 def compare_densities(font_pair: str = "merriweather-merriweather"):
     """Compare all density presets side by side."""
     print(f"Density Comparison ({FONT_PAIRS[font_pair].name})")
@@ -753,37 +759,20 @@ def compare_densities(font_pair: str = "merriweather-merriweather"):
     print(f"{'':15} {'tight':>10} {'snug':>10} {'normal':>10} {'relaxed':>10} {'loose':>10}")
     print("-" * 70)
 
-    systems = {d: TypographySystem(font_pair, d) for d in DENSITY_PRESETS.keys()}
-
-    # Base size
-    print(f"{'Base size':15}", end="")
-    for d in DENSITY_PRESETS.keys():
-        print(f"{systems[d].baseline_pt:>10.1f}", end="")
-    print(" pt")
-
-    # Line height body
-    print(f"{'Line height':15}", end="")
-    for d in DENSITY_PRESETS.keys():
-        print(f"{systems[d].line_heights['body']:>10.2f}", end="")
-    print()
-
-    # H1 size
-    print(f"{'H1 size':15}", end="")
-    for d in DENSITY_PRESETS.keys():
-        print(f"{systems[d].type_scale_pt['h1']:>10.1f}", end="")
-    print(" pt")
-
-    # Body size
-    print(f"{'Body size':15}", end="")
-    for d in DENSITY_PRESETS.keys():
-        print(f"{systems[d].type_scale_pt['body']:>10.1f}", end="")
-    print(" pt")
-
-    # Paragraph spacing
-    print(f"{'Para spacing':15}", end="")
-    for d in DENSITY_PRESETS.keys():
-        print(f"{systems[d].space_scale_pt['md']:>10.1f}", end="")
-    print(" pt")
+    # Each row only needs a handful of scalars, so derive them per preset column
+    # with the same rounding as TypographySystem rather than building full systems
+    optical_factor = FONT_PAIRS[font_pair].optical_adjustment()
+    baselines = [round(size * optical_factor, 2) for size in _DENSITY_COLUMNS["base_size_pt"]]
+    rows = (
+        ("Base size", baselines, ".1f", " pt"),
+        ("Line height", _DENSITY_COLUMNS["line_height_body"], ".2f", ""),
+        ("H1 size", [round(b * TYPE_SCALE[-1], 2) for b in baselines], ".1f", " pt"),
+        ("Body size", [round(b * TYPE_SCALE[2], 2) for b in baselines], ".1f", " pt"),
+        ("Para spacing", [round(b * SPACE_SCALE[3] * f, 2)
+                          for b, f in zip(baselines, _DENSITY_COLUMNS["para_spacing_factor"])], ".1f", " pt"),
+    )
+    for label, values, fmt, unit in rows:
+        print(f"{label:15}" + "".join(f"{v:>10{fmt}}" for v in values) + unit)
 
 
 # =============================================================================
@@ -828,14 +817,14 @@ if __name__ == "__main__":
         font_pair = sys.argv[2] if len(sys.argv) > 2 else "merriweather-merriweather"
         density = sys.argv[3] if len(sys.argv) > 3 else "normal"
 
-        system = TypographySystem(font_pair, density)
+        system = get_typography_system(font_pair, density)
         print(system.to_css_variables())
 
     elif command == "summary":
         font_pair = sys.argv[2] if len(sys.argv) > 2 else "merriweather-merriweather"
         density = sys.argv[3] if len(sys.argv) > 3 else "normal"
 
-        system = TypographySystem(font_pair, density)
+        system = get_typography_system(font_pair, density)
         print(system.summary())
 
     elif command == "extract-x-heights":
@@ -24,98 +24,140 @@ THINSP = '\u2009'  # thin space
 HAIRSP = '\u200A'  # hair space
 NBSP = '\u00A0'   # non-breaking space
 
+# Abbreviations followed by a non-breaking space (Mr. Mrs. Dr. Prof. etc.)
+ABBREVIATIONS = ['Mr', 'Mrs', 'Ms', 'Dr', 'Prof', 'Sr', 'Jr', 'vs', 'etc', 'Vol', 'No', 'Fig', 'Ch', 'p', 'pp']
+
+# Compiled once at import; the functions below run on every chapter
+_EM_DASH_TRIPLE_RE = re.compile(r'\s*---\s*')
+_EM_DASH_SPACED_RE = re.compile(r'\s+--\s+')
+_EN_DASH_DIGITS_RE = re.compile(r'(?<=\d)--(?=\d)')
+_EN_DASH_WORDS_RE = re.compile(r'(?<=\w)--(?=\w)')
+# Quotes in opening position; the rest close. Curly quotes are in neither
+# lookbehind set, so converting one kind first can't change the other's context.
+_OPEN_DQUOTE_RE = re.compile(rf'(?:^|(?<=[ \n\t(\[{{{MDASH}{NDASH}]))"')
+_OPEN_SQUOTE_RE = re.compile(rf"(?:^|(?<=[ \n\t(\[{{{MDASH}]))'(?=(.?))", re.DOTALL)
+# Straight quotes left over after the opening ones are converted
+_CLOSE_QUOTES = str.maketrans({'"': RDQUO, "'": RSQUO})
+# Text without any of these is left unchanged by every typography pass:
+# dots, hyphens, straight quotes, punctuation and opening quotes that get
+# non-breaking spaces, and double spaces
+_TYPOGRAPHY_TRIGGER_RE = re.compile(rf'[.\-"\'?!:;»«{LDQUO}]|  ')
+_ELLIPSIS_RE = re.compile(r'\.{3,}')
+_SPACE_BEFORE_PUNCT_RE = re.compile(r' ([?!:;»])')
+_SPACE_AFTER_OPEN_QUOTE_RE = re.compile(rf'([«{LDQUO}]) ')
+_MULTI_SPACE_RE = re.compile(r'  +')
+
+
+def _abbreviation_pattern(abbrevs) -> str:
+    r"""Regex matching any of abbrevs as a whole word, followed by '.' and whitespace.
+
+    Same matches as \b(Mr|Mrs|...)\.\s+, but each alternative starts with a
+    literal letter and checks the word boundary in a lookbehind after it, so
+    the regex engine can skip ahead to candidate letters instead of trying
+    every position.
+    """
+    by_initial = {}
+    for abbr in abbrevs:
+        by_initial.setdefault(abbr[0], []).append(re.escape(abbr[1:]))
+    branches = '|'.join(
+        f'{initial}(?<!\\w{initial})(?:{"|".join(sorted(rests, key=len, reverse=True))})'
+        for initial, rests in by_initial.items()
+    )
+    return rf'((?:{branches}))\.\s+'
+
+
+_ABBREVIATION_RE = re.compile(_abbreviation_pattern(ABBREVIATIONS))
+
+# Markdown regions left untouched by process_markdown_preserving_code, as one
+# alternation so the text is scanned once. Where two could start at the same
+# place, the earlier alternative wins: YAML frontmatter (only at the very
+# start of the document, so the engine tries it once), horizontal rules
+# (--- or *** or ___ on own line), table separator lines (|---|---|), table
+# rows (lines starting with |), code blocks, inline code, HTML tags.
+_PRESERVE_RE = re.compile(
+    r'(?s:\A---\s*\n.*?\n---\s*$)'
+    r'|^[-*_]{3,}\s*$'
+    r'|^\|[-:\|\s]+\|$'
+    r'|^\|.*\|$'
+    r'|(?s:```.*?```)'
+    r'|`[^`]+`'
+    r'|<[^>]+>',
+    re.MULTILINE,
+)
+# Characters at least one preserve alternative needs
+_PRESERVE_TRIGGER_RE = re.compile(r'[-*_|`<]')
+_PLACEHOLDER_RE = re.compile(r'\x00PRESERVED(\d+)\x00')
+
 
 def smart_quotes(text: str) -> str:
-    """Convert straight quotes to curly quotes."""
-    result = []
-    prev_char = ' '
-
-    i = 0
-    while i < len(text):
-        char = text[i]
-
-        if char == '"':
-            # Check if opening or closing
-            if prev_char in ' \n\t([{' or prev_char == MDASH or prev_char == NDASH:
-                result.append(LDQUO)
-            else:
-                result.append(RDQUO)
-
-        elif char == "'":
-            # Handle contractions (don't, it's, '90s)
-            next_char = text[i + 1] if i + 1 < len(text) else ''
-
-            # Apostrophe in contractions
-            if prev_char.isalpha() and next_char.isalpha():
-                result.append(RSQUO)
-            # 's, 't, 'll, 're, etc. at word end
-            elif prev_char.isalpha() and next_char in 'stdlmrv':
-                result.append(RSQUO)
-            # '90s style year abbreviations
-            elif next_char.isdigit():
-                result.append(RSQUO)
-            # Opening quote
-            elif prev_char in ' \n\t([{' or prev_char == MDASH:
-                result.append(LSQUO)
-            # Closing quote
-            else:
-                result.append(RSQUO)
-
-        else:
-            result.append(char)
-
-        prev_char = char
-        i += 1
-
-    return ''.join(result)
+    """Convert straight quotes to curly quotes.
+
+    A quote opens at the start of the text or after whitespace or an opening
+    bracket (or an em dash; en dash too for double quotes), and closes
+    everywhere else. A single quote right before a digit is always an
+    apostrophe ('90s), as are contractions (don't, it's).
+    """
+    # Both opening patterns and the closing translation need a straight quote
+    if '"' not in text and "'" not in text:
+        return text
+
+    text = _OPEN_DQUOTE_RE.sub(LDQUO, text)
+    text = _OPEN_SQUOTE_RE.sub(_open_squote, text)
+    return text.translate(_CLOSE_QUOTES)
+
+
+def _open_squote(match: re.Match) -> str:
+    # str.isdigit() rather than \d, so superscript digits count too
+    return RSQUO if match.group(1).isdigit() else LSQUO
 
 
 def smart_dashes(text: str) -> str:
     """Convert double/triple hyphens to en/em dashes."""
+    # Every pattern below needs a double hyphen
+    if '--' not in text:
+        return text
+
     # Triple hyphen or double hyphen with spaces → em dash with thin spaces
-    text = re.sub(r'\s*---\s*', f'{THINSP}{MDASH}{THINSP}', text)
-    text = re.sub(r'\s+--\s+', f'{THINSP}{MDASH}{THINSP}', text)
+    text = _EM_DASH_TRIPLE_RE.sub(f'{THINSP}{MDASH}{THINSP}', text)
+    text = _EM_DASH_SPACED_RE.sub(f'{THINSP}{MDASH}{THINSP}', text)
 
     # Double hyphen without spaces (ranges) → en dash
-    text = re.sub(r'(?<=\d)--(?=\d)', NDASH, text)  # 1990--2000
-    text = re.sub(r'(?<=\w)--(?=\w)', NDASH, text)  # word--word
+    text = _EN_DASH_DIGITS_RE.sub(NDASH, text)  # 1990--2000
+    text = _EN_DASH_WORDS_RE.sub(NDASH, text)  # word--word
 
     # Remaining double hyphens → em dash
-    text = re.sub(r'--', MDASH, text)
+    text = text.replace('--', MDASH)
 
     return text
 
 
 def smart_ellipsis(text: str) -> str:
     """Convert three dots to proper ellipsis."""
-    # Three or more dots → ellipsis
-    text = re.sub(r'\.{3,}', ELLIP, text)
-    return text
+    # Three or more dots → ellipsis; without a longer run of dots, every
+    # match is exactly three, which str.replace handles without the regex
+    if '....' not in text:
+        return text.replace('...', ELLIP)
+    return _ELLIPSIS_RE.sub(ELLIP, text)
 
 
 def smart_spaces(text: str) -> str:
     """Fix spacing issues."""
     # Non-breaking space before punctuation that shouldn't break
-    text = re.sub(r' ([?!:;»])', f'{NBSP}\\1', text)
+    text = _SPACE_BEFORE_PUNCT_RE.sub(f'{NBSP}\\1', text)
 
     # Non-breaking space after opening quotes/guillemets
-    text = re.sub(rf'([«{LDQUO}]) ', f'\\1{NBSP}', text)
+    text = _SPACE_AFTER_OPEN_QUOTE_RE.sub(f'\\1{NBSP}', text)
 
     # Remove double spaces
-    text = re.sub(r'  +', ' ', text)
+    text = _MULTI_SPACE_RE.sub(' ', text)
 
     return text
 
 
 def fix_abbreviations(text: str) -> str:
     """Handle common abbreviations with non-breaking spaces."""
-    # Mr. Mrs. Dr. Prof. etc.
-    abbrevs = ['Mr', 'Mrs', 'Ms', 'Dr', 'Prof', 'Sr', 'Jr', 'vs', 'etc', 'Vol', 'No', 'Fig', 'Ch', 'p', 'pp']
-    for abbr in abbrevs:
-        # Mr. X → Mr.NBSP X (non-breaking)
-        text = re.sub(rf'\b({abbr})\.\s+', f'\\1.{NBSP}', text)
-
-    return text
+    # Mr. X → Mr.NBSP X (non-breaking), all abbreviations in one pass
+    return _ABBREVIATION_RE.sub(f'\\1.{NBSP}', text)
 
 
 def process_typography(text: str, options: dict = None) -> str:
@@ -141,6 +183,10 @@ def process_typography(text: str, options: dict = None) -> str:
     }
     opts.update(options)
 
+    # Nothing any pass could change: skip all five scans
+    if not _TYPOGRAPHY_TRIGGER_RE.search(text):
+        return text
+
     # Apply transformations in order
     if opts['ellipsis']:
         text = smart_ellipsis(text)
@@ -158,18 +204,9 @@ def process_typography(text: str, options: dict = None) -> str:
 
 def process_markdown_preserving_code(text: str, options: dict = None) -> str:
     """Process typography while preserving code blocks, tables, and inline code."""
-    # Patterns to preserve
-    code_block_pattern = re.compile(r'```.*?```', re.DOTALL)
-    inline_code_pattern = re.compile(r'`[^`]+`')
-    html_tag_pattern = re.compile(r'<[^>]+>')
-    # Markdown table rows (lines starting with |)
-    table_row_pattern = re.compile(r'^\|.*\|$', re.MULTILINE)
-    # Table separator lines (|---|---|)
-    table_sep_pattern = re.compile(r'^\|[-:\|\s]+\|$', re.MULTILINE)
-    # Horizontal rules (--- or *** or ___ on own line)
-    hr_pattern = re.compile(r'^[-*_]{3,}\s*$', re.MULTILINE)
-    # YAML frontmatter
-    frontmatter_pattern = re.compile(r'^---\s*\n.*?\n---\s*$', re.MULTILINE | re.DOTALL)
+    # No character any preserved region starts with: nothing to set aside
+    if not _PRESERVE_TRIGGER_RE.search(text):
+        return process_typography(text, options)
 
     # Extract and replace with placeholders
     preserved = []
@@ -178,23 +215,18 @@ def process_markdown_preserving_code(text: str, options: dict = None) -> str:
         preserved.append(match.group(0))
         return f'\x00PRESERVED{len(preserved) - 1}\x00'
 
-    # Preserve in order (frontmatter, hr, tables, then code)
-    text = frontmatter_pattern.sub(preserve, text)
-    text = hr_pattern.sub(preserve, text)
-    text = table_sep_pattern.sub(preserve, text)
-    text = table_row_pattern.sub(preserve, text)
-    text = code_block_pattern.sub(preserve, text)
-    text = inline_code_pattern.sub(preserve, text)
-    text = html_tag_pattern.sub(preserve, text)
+    text = _PRESERVE_RE.sub(preserve, text)
 
     # Process typography
     text = process_typography(text, options)
 
-    # Restore preserved content
-    for i, content in enumerate(preserved):
-        text = text.replace(f'\x00PRESERVED{i}\x00', content)
+    # Restore preserved content in one pass; NUL can't occur in real markdown,
+    # but an out-of-range index is left alone like before rather than raising
+    def restore(match):
+        i = int(match.group(1))
+        return preserved[i] if i < len(preserved) else match.group(0)
 
-    return text
+    return _PLACEHOLDER_RE.sub(restore, text)
 
 
 # Quick test
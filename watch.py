@@ -1,19 +1,25 @@
 #!/usr/bin/env python3
 """Watch mode for BookCrafter - live preview with auto-rebuild."""
 
+import os
 import sys
+import hashlib
 import time
 import threading
+import functools
+import queue
 import http.server
-import socketserver
 from pathlib import Path
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.observers.polling import PollingObserver
+from watchdog.events import PatternMatchingEventHandler
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from build import setup_instance, load_file, load_styles, STYLES_DIR
+import instance
+from instance import STYLES_DIR
+from styles import load as load_styles
 from content_parser import (
     parse_frontmatter_file, parse_content_file, parse_backmatter_file,
 )
@@ -22,43 +28,119 @@ from templates import render_frontmatter, render_backmatter, assemble_book
 # Configuration
 PORT = 8000
 DEBOUNCE_SECONDS = 0.5
+# Scan interval when native file watching is unavailable
+POLL_SECONDS = 1.0
+RELOAD_PATH = "/__reload"
+# Files whose changes trigger a rebuild; editor swap, backup and lock files never do
+WATCH_PATTERNS = ["*.md", "*.css", "*.html"]
+WATCH_IGNORE_PATTERNS = ["*~", ".#*", "*.swp", "*.swx"]
+# Comment line sent on idle event streams, so closed tabs are noticed
+SSE_KEEPALIVE_SECONDS = 15
+
+# Separator around each rebuild's console output
+_RULE = "=" * 60
+
+# Injected before </body>: reloads the page when the server pushes a build event
+_RELOAD_SCRIPT = f'''
+<script>
+new EventSource('{RELOAD_PATH}').onmessage = function() {{
+    window.location.reload();
+}};
+</script>
+'''.encode("utf-8")
+
+
+def _css_signature(dirs):
+    """Cheap fingerprint of the CSS files in dirs: (path, mtime_ns, size) for each."""
+    sig = []
+    for d in dirs:
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.name.endswith('.css') and entry.is_file():
+                        st = entry.stat()
+                        sig.append((entry.path, st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            continue
+    return tuple(sorted(sig))
+
+
+class ReloadNotifier:
+    """Wakes the live-reload event streams after each successful build."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self.generation = 0
+
+    def notify(self):
+        with self._cond:
+            self.generation += 1
+            self._cond.notify_all()
+
+    def wait(self, generation, timeout):
+        """Block until a build newer than generation (or timeout); return the latest generation."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.generation != generation, timeout)
+            return self.generation
+
 
+reload_notifier = ReloadNotifier()
 
-class RebuildHandler(FileSystemEventHandler):
+
+class RebuildHandler(PatternMatchingEventHandler):
     """Handler that triggers rebuild on file changes."""
 
     def __init__(self, builder):
+        # Watchdog drops directories and unrelated files before dispatching
+        super().__init__(patterns=WATCH_PATTERNS, ignore_patterns=WATCH_IGNORE_PATTERNS,
+                         ignore_directories=True)
         self.builder = builder
         self.last_rebuild = 0
-        self.pending = False
+        # Observer callbacks only queue changed paths; one consumer thread
+        # coalesces them and runs every rebuild, so rebuilds never overlap
+        self._queue = queue.SimpleQueue()
+        threading.Thread(target=self._consume, name="rebuild", daemon=True).start()
 
     def on_modified(self, event):
-        if event.is_directory:
-            return
-
-        path = Path(event.src_path)
-
-        # Only watch relevant files
-        if path.suffix not in ['.md', '.css', '.html']:
-            return
-
-        # Debounce rapid changes
-        now = time.time()
-        if now - self.last_rebuild < DEBOUNCE_SECONDS:
-            self.pending = True
-            return
-
-        self.last_rebuild = now
-        self.builder.rebuild()
+        self._queue.put(Path(event.src_path))
 
     def on_created(self, event):
         self.on_modified(event)
 
+    def on_moved(self, event):
+        # Editors that save by renaming a temp file over the original. Moves
+        # match on either path, so also skip e.g. Content.md -> Content.md.bak
+        path = Path(event.dest_path)
+        if any(path.match(pattern) for pattern in WATCH_PATTERNS):
+            self._queue.put(path)
+
+    def _consume(self):
+        while True:
+            dirty = {self._queue.get()}
+
+            # Debounce rapid changes: the first change after a quiet spell
+            # rebuilds right away (with whatever arrived alongside it); changes
+            # during or just after a rebuild are gathered until DEBOUNCE_SECONDS
+            # pass without another, so the last change of a burst always gets built
+            quiet = time.monotonic() - self.last_rebuild >= DEBOUNCE_SECONDS
+            try:
+                while True:
+                    if quiet:
+                        dirty.add(self._queue.get_nowait())
+                    else:
+                        dirty.add(self._queue.get(timeout=DEBOUNCE_SECONDS))
+            except queue.Empty:
+                pass
+
+            self.builder.rebuild(dirty=frozenset(dirty))
+            self.last_rebuild = time.monotonic()
+
 
 class LiveBuilder:
     """Manages live rebuilding of the book."""
 
-    def __init__(self, config, content_dir, output_dir, target=None, typography=None, pages=200):
+    def __init__(self, config, content_dir, output_dir, target=None, typography=None, pages=200,
+                 instance_styles_dir=None):
         self.config = config
         self.content_dir = content_dir
         self.output_dir = output_dir
@@ -67,34 +149,98 @@ class LiveBuilder:
         self.pages = pages
         self.html_path = output_dir / f"{config['slug']}.html"
         self.rebuild_count = 0
-
-    def rebuild(self):
-        """Rebuild HTML for preview."""
+        # Parsed content files by path: (mtime_ns, size) at parse time, result
+        self._parse_cache = {}
+        self.styles_dirs = [d for d in (STYLES_DIR, instance_styles_dir) if d]
+        # load_styles results by options, valid while the CSS files are unchanged
+        self._css_cache = {}
+        self._css_sig = None
+        # Last rendered front/back matter: name -> (inputs, repr of inputs, html)
+        self._render_cache = {}
+        # Digest of the HTML last written, to skip writes (and reloads) that change
+        # nothing, and the file's (mtime_ns, size) right after that write
+        self._html_digest = None
+        self._html_stat = None
+
+    def _cached_parse(self, filename, parser, default, dirty=None):
+        """Parse a content file, reusing the last result while it is unchanged on disk.
+
+        A file in dirty is always re-parsed, even if its mtime and size look
+        the same (coarse filesystem timestamps, same-length edits).
+        """
+        path = self.content_dir / filename
+        try:
+            st = path.stat()
+            key = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            key = None
+
+        cached = self._parse_cache.get(path)
+        if cached is not None and cached[0] == key and not (dirty and path in dirty):
+            return cached[1]
+
+        # Same as instance.load_file, without a second stat of the path
+        raw = path.read_text() if key is not None else ""
+        parsed = parser(raw) if raw else default
+        self._parse_cache[path] = (key, parsed)
+        return parsed
+
+    def _cached_styles(self):
+        """Load styles, reusing the last result while no CSS file changed."""
+        sig = _css_signature(self.styles_dirs)
+        if sig != self._css_sig:
+            self._css_cache.clear()
+            self._css_sig = sig
+
+        key = (self.target, self.pages, self.typography)
+        css = self._css_cache.get(key)
+        if css is None:
+            css = self._css_cache[key] = load_styles(target=self.target, page_count=self.pages,
+                                                     typography=self.typography)
+        return css
+
+    def _render_cached(self, name, render, *inputs):
+        """Return render(*inputs, config), reusing the last HTML while the inputs are equal."""
+        cached = self._render_cache.get(name)
+        # Unchanged files come back from the parse cache as the same objects
+        if cached is not None and all(a is b for a, b in zip(cached[0], inputs)):
+            return cached[2]
+
+        # Re-parsed inputs are compared by value: editing Content.md yields a
+        # new TOC list, which is usually equal to the last one
+        key = repr(inputs)
+        html = cached[2] if cached is not None and cached[1] == key else render(*inputs, self.config)
+        self._render_cache[name] = (inputs, key, html)
+        return html
+
+    def rebuild(self, dirty=None):
+        """Rebuild HTML for preview.
+
+        dirty: paths changed since the last rebuild, if the caller knows them.
+        """
         self.rebuild_count += 1
-        print(f"\n{'='*60}")
-        print(f"Rebuild #{self.rebuild_count} at {time.strftime('%H:%M:%S')}")
-        print('='*60)
+        # One write per message block, so it takes stdout's lock once
+        print(f"\n{_RULE}\nRebuild #{self.rebuild_count} at {time.strftime('%H:%M:%S')}\n{_RULE}")
 
         try:
             start = time.time()
 
-            # Load content
+            # Load and parse content (only files changed since the last rebuild)
             content_config = self.config.get("content", {})
-            frontmatter_raw = load_file(content_config.get("frontmatter", "FrontMatter.md"))
-            content_raw = load_file(content_config.get("content", "Content.md"))
-            backmatter_raw = load_file(content_config.get("backmatter", "Backmatter.md"))
-
-            # Parse
-            frontmatter = parse_frontmatter_file(frontmatter_raw) if frontmatter_raw else {}
-            content = parse_content_file(content_raw) if content_raw else {'html': '', 'toc': []}
-            backmatter = parse_backmatter_file(backmatter_raw) if backmatter_raw else {}
+            frontmatter = self._cached_parse(content_config.get("frontmatter", "FrontMatter.md"),
+                                             parse_frontmatter_file, {}, dirty)
+            content = self._cached_parse(content_config.get("content", "Content.md"),
+                                         parse_content_file, {'html': '', 'toc': []}, dirty)
+            backmatter = self._cached_parse(content_config.get("backmatter", "Backmatter.md"),
+                                            parse_backmatter_file, {}, dirty)
 
             # Load styles
-            css = load_styles(target=self.target, page_count=self.pages, typography=self.typography)
+            css = self._cached_styles()
 
-            # Render
-            frontmatter_html = render_frontmatter(frontmatter, content['toc'], self.config)
-            backmatter_html = render_backmatter(backmatter, self.config)
+            # Render (front and back matter rarely change between rebuilds)
+            frontmatter_html = self._render_cached("frontmatter", render_frontmatter,
+                                                   frontmatter, content['toc'])
+            backmatter_html = self._render_cached("backmatter", render_backmatter, backmatter)
 
             # Assemble with live reload script
             full_html = assemble_book(
@@ -105,32 +251,46 @@ class LiveBuilder:
                 self.config
             )
 
-            # Add live reload script
-            reload_script = '''
-<script>
-(function() {
-    var lastModified = null;
-    setInterval(function() {
-        fetch(window.location.href, {method: 'HEAD'})
-            .then(function(response) {
-                var modified = response.headers.get('Last-Modified');
-                if (lastModified && modified !== lastModified) {
-                    window.location.reload();
-                }
-                lastModified = modified;
-            });
-    }, 1000);
-})();
-</script>
-'''
-            full_html = full_html.replace('</body>', reload_script + '</body>')
-
-            # Write
-            self.html_path.write_text(full_html)
+            # Add live reload script before the closing body tag; the template
+            # ends with it, so searching from the end finds it straight away
+            # Encoded once, as UTF-8 like the template's <meta charset>, whatever
+            # the locale; the same bytes are hashed and written
+            body_end = full_html.rfind('</body>')
+            if body_end < 0:
+                parts = (full_html.encode("utf-8"),)
+            else:
+                parts = (full_html[:body_end].encode("utf-8"), _RELOAD_SCRIPT,
+                         full_html[body_end:].encode("utf-8"))
+
+            # Write, then tell open previews to reload
+            h = hashlib.blake2b(digest_size=16)
+            for part in parts:
+                h.update(part)
+            digest = h.digest()
+            # Only skip while the file is still ours: `cli preview` writes the
+            # same path without the reload script, and it may have been deleted
+            try:
+                st = self.html_path.stat()
+                html_stat = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                html_stat = None
+            if digest == self._html_digest and html_stat == self._html_stat:
+                print(f"Unchanged: {self.html_path.name} ({time.time() - start:.2f}s)")
+                return
+            # Via a sibling file and an atomic rename, so the server never
+            # hands a browser a half-written page
+            tmp_path = self.html_path.with_suffix(".html.tmp")
+            with open(tmp_path, "wb") as f:
+                f.writelines(parts)
+            os.replace(tmp_path, self.html_path)
+            st = self.html_path.stat()
+            self._html_digest = digest
+            self._html_stat = (st.st_mtime_ns, st.st_size)
+            reload_notifier.notify()
 
             elapsed = time.time() - start
-            print(f"Built: {self.html_path.name} ({elapsed:.2f}s)")
-            print(f"Preview: http://localhost:{PORT}/{self.html_path.name}")
+            print(f"Built: {self.html_path.name} ({elapsed:.2f}s)\n"
+                  f"Preview: http://localhost:{PORT}/{self.html_path.name}")
 
         except Exception as e:
             print(f"Build error: {e}")
@@ -141,23 +301,81 @@ class LiveBuilder:
 class QuietHandler(http.server.SimpleHTTPRequestHandler):
     """HTTP handler that suppresses most logs."""
 
+    # Keep-alive, so a reload fetches the page, CSS, fonts and images over
+    # one connection instead of a TCP handshake each
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == RELOAD_PATH:
+            self._stream_reload_events()
+        else:
+            super().do_GET()
+
+    def _stream_reload_events(self):
+        """Server-sent events: one "reload" message per finished build."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        # No Content-Length: the stream runs until either side closes it
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        generation = reload_notifier.generation
+        try:
+            while True:
+                latest = reload_notifier.wait(generation, SSE_KEEPALIVE_SECONDS)
+                if latest != generation:
+                    generation = latest
+                    self.wfile.write(b"data: reload\n\n")
+                else:
+                    self.wfile.write(b": keep-alive\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Tab closed or reloaded
+
     def log_message(self, format, *args):
         # Only log errors
         if args[1] != '200':
             super().log_message(format, *args)
 
 
+def start_observer(handler, paths):
+    """Watch paths with one observer, falling back to polling if native watching fails.
+
+    inotify refuses new watches once fs.inotify.max_user_watches (or the
+    instance limit) is used up, and network mounts / WSL may not deliver
+    events at all; polling is slower to notice changes but never misses them.
+    """
+    observer = Observer()
+    for path in paths:
+        observer.schedule(handler, str(path), recursive=True)
+    try:
+        observer.start()
+        return observer
+    except OSError as e:
+        observer.stop()
+        print(f"Native file watching unavailable ({e}), falling back to polling")
+
+    observer = PollingObserver(timeout=POLL_SECONDS)
+    for path in paths:
+        observer.schedule(handler, str(path), recursive=True)
+    observer.start()
+    return observer
+
+
 def serve(directory, port):
     """Start HTTP server in background."""
-    import os
-    os.chdir(directory)
-    with socketserver.TCPServer(("", port), QuietHandler) as httpd:
+    # Serve directory without chdir, which would race the builder in the main thread
+    handler = functools.partial(QuietHandler, directory=str(directory))
+    # Threaded, since every open preview holds a live-reload stream open;
+    # ThreadingHTTPServer also uses daemon threads and allows address reuse
+    with http.server.ThreadingHTTPServer(("", port), handler) as httpd:
         httpd.serve_forever()
 
 
 def main():
     import argparse
-    import build
 
     parser = argparse.ArgumentParser(description="Watch and rebuild book on changes")
     parser.add_argument("--instance", "-i", help="Instance to build")
@@ -168,27 +386,33 @@ def main():
     parser.add_argument("--no-browser", action="store_true", help="Don't open browser")
     args = parser.parse_args()
 
-    # Set up instance (this sets build.CONTENT_DIR, build.OUTPUT_DIR, etc.)
-    config = setup_instance(args.instance)
+    # Set up instance, then read the paths it sets once
+    config = instance.setup(args.instance)
+    content_dir = instance.CONTENT_DIR
+    output_dir = instance.OUTPUT_DIR
+    instance_styles_dir = instance.INSTANCE_STYLES_DIR
 
     builder = LiveBuilder(
         config=config,
-        content_dir=build.CONTENT_DIR,
-        output_dir=build.OUTPUT_DIR,
+        content_dir=content_dir,
+        output_dir=output_dir,
         target=args.target,
         typography=args.typography,
-        pages=args.pages
+        pages=args.pages,
+        instance_styles_dir=instance_styles_dir,
     )
 
-    # Initial build
-    builder.rebuild()
-
-    # Start HTTP server in background (serve from output dir)
-    server_thread = threading.Thread(target=serve, args=(build.OUTPUT_DIR, args.port), daemon=True)
+    # Start HTTP server in background (serve from output dir), so it is up
+    # by the time the initial build finishes
+    server_thread = threading.Thread(target=serve, args=(output_dir, args.port), daemon=True)
     server_thread.start()
 
+    # Initial build; the browser only opens afterwards, since a 404 page
+    # carries no live-reload script to recover with
+    builder.rebuild()
+
     print(f"\nServer running at http://localhost:{args.port}/")
-    print(f"Watching: {build.CONTENT_DIR}, {STYLES_DIR}")
+    print(f"Watching: {content_dir}, {STYLES_DIR}")
     print("Press Ctrl+C to stop\n")
 
     # Open browser
@@ -198,12 +422,10 @@ def main():
 
     # Set up file watcher
     handler = RebuildHandler(builder)
-    observer = Observer()
-    observer.schedule(handler, str(build.CONTENT_DIR), recursive=True)
-    observer.schedule(handler, str(STYLES_DIR), recursive=True)
-    if build.INSTANCE_STYLES_DIR and build.INSTANCE_STYLES_DIR.exists():
-        observer.schedule(handler, str(build.INSTANCE_STYLES_DIR), recursive=True)
-    observer.start()
+    watch_paths = [content_dir, STYLES_DIR]
+    if instance_styles_dir and instance_styles_dir.exists():
+        watch_paths.append(instance_styles_dir)
+    observer = start_observer(handler, watch_paths)
 
     try:
         while True: